@@ -2,16 +2,16 @@
 
 import asyncio
 import logging
+from contextlib import AsyncExitStack
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    EVENT_HOMEASSISTANT_STARTED,
-    EVENT_HOMEASSISTANT_STOP,
-)
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -22,7 +22,7 @@ from .const import (
     DOMAIN,
     PLATFORMS,
 )
-from .coordinator import FIRST_REFRESH_TIMEOUT, ElectroluxCoordinator
+from .coordinator import ElectroluxCoordinator
 from .util import get_electrolux_session
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
@@ -30,9 +30,22 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
+# API clients kept across reloads, keyed by entry id, so the in-memory token pair
+# survives an options update or a reload
+CLIENT_CACHE = "_client_cache"
+
+
 # noinspection PyUnusedLocal
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up this integration using YAML is not supported."""
+
+    async def _close_cached_clients(event):
+        """Close clients left in the cache by unloaded entries on HA shutdown."""
+        clients = hass.data.get(DOMAIN, {}).pop(CLIENT_CACHE, {})
+        for _, client in clients.values():
+            await client.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _close_cached_clients)
     return True
 
 
@@ -50,7 +63,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     refresh_token = entry.data.get(CONF_REFRESH_TOKEN) or ""
     session = async_get_clientsession(hass)
 
-    client = get_electrolux_session(api_key, access_token, refresh_token, session, hass)
+    # Reuse the client from the previous setup of this entry unless credentials changed
+    credentials = (api_key, access_token, refresh_token)
+    cached = hass.data[DOMAIN].setdefault(CLIENT_CACHE, {}).pop(entry.entry_id, None)
+    if cached and cached[0] == credentials:
+        _LOGGER.debug("Electrolux reusing cached API client")
+        client = cached[1]
+    else:
+        if cached:
+            await cached[1].close()
+        client = get_electrolux_session(
+            api_key, access_token, refresh_token, session, hass
+        )
     coordinator = ElectroluxCoordinator(
         hass,
         client=client,
@@ -59,69 +83,110 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     coordinator.config_entry = entry
 
-    # Authenticate
-    if not await coordinator.async_login():
-        raise ConfigEntryAuthFailed("Electrolux wrong credentials")
-
-    # Store coordinator
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    # Initialize entities
-    _LOGGER.debug("async_setup_entry setup_entities")
-    await coordinator.setup_entities()
-    _LOGGER.debug("async_setup_entry listen_websocket")
-    # Start websocket listening as background task to avoid blocking setup
-    coordinator.hass.async_create_task(coordinator.listen_websocket())
-
-    _LOGGER.debug("async_setup_entry async_config_entry_first_refresh")
-    try:
-        await asyncio.wait_for(
-            coordinator.async_config_entry_first_refresh(),
-            timeout=FIRST_REFRESH_TIMEOUT,
-        )
-    except (asyncio.TimeoutError, Exception) as err:
-        # Handle both timeouts and other exceptions gracefully
-        _LOGGER.warning(
-            "Electrolux first refresh failed or timed out (%s); will retry in background",
-            err,
+    # Roll back everything acquired below if setup exits early for any reason
+    async with AsyncExitStack() as cleanup:
+        cleanup.push_async_callback(client.close)
+
+        # Authenticate
+        if not await coordinator.async_login():
+            raise ConfigEntryAuthFailed("Electrolux wrong credentials")
+
+        # Store coordinator
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+        cleanup.callback(hass.data[DOMAIN].pop, entry.entry_id, None)
+
+        # Initialize entities
+        # The appliance list fetched here is needed by both the websocket listener
+        # and the first refresh, so it has to complete before either starts
+        _LOGGER.debug("async_setup_entry setup_entities")
+        await coordinator.setup_entities()
+        _LOGGER.debug("async_setup_entry listen_websocket")
+        # Start websocket listening as a task so the SSE handshake overlaps with the first refresh.
+        # eager_start runs it up to its first await immediately instead of on the next loop iteration
+        listen_task = hass.async_create_task(
+            coordinator.listen_websocket(),
+            name=f"Electrolux listen - {entry.title}",
+            eager_start=True,
         )
-        # Don't set last_update_success to False here - let HA retry naturally
+        cleanup.callback(listen_task.cancel)
 
-    if not coordinator.last_update_success:
-        raise ConfigEntryNotReady
+        _LOGGER.debug("async_setup_entry extend PLATFORMS")
+        coordinator.platforms.extend(PLATFORMS)
 
-    _LOGGER.debug("async_setup_entry extend PLATFORMS")
-    coordinator.platforms.extend(PLATFORMS)
+        # Call async_setup_entry in entity files while the first refresh runs, so the
+        # platform imports overlap with the cloud round trip
+        _LOGGER.debug("async_setup_entry async_forward_entry_setups")
+        forward_task = hass.async_create_task(
+            hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+            eager_start=True,
+        )
 
-    # Call async_setup_entry in entity files
-    _LOGGER.debug("async_setup_entry async_forward_entry_setups")
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        _LOGGER.debug("async_setup_entry async_config_entry_first_refresh")
+        listen_result: Any
+        forward_result: Any
+        refresh_result: Any
+        listen_result, forward_result, refresh_result = await asyncio.gather(
+            listen_task,
+            forward_task,
+            asyncio.wait_for(
+                coordinator.async_config_entry_first_refresh(),
+                timeout=coordinator.first_refresh_timeout,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(forward_result, BaseException):
+            raise forward_result
+        # Platforms were forwarded alongside the refresh, unload them if setup fails from here on
+        cleanup.push_async_callback(
+            hass.config_entries.async_unload_platforms, entry, PLATFORMS
+        )
+        if isinstance(listen_result, Exception):
+            _LOGGER.warning(
+                "Electrolux websocket listener failed to start (%s); renewal will retry",
+                listen_result,
+            )
+        if isinstance(refresh_result, (asyncio.CancelledError, ConfigEntryAuthFailed)):
+            # Cancellation (entry unloaded mid-setup) and auth failures must propagate
+            raise refresh_result
+        if isinstance(refresh_result, Exception):
+            # Handle both timeouts and other exceptions gracefully
+            _LOGGER.warning(
+                "Electrolux first refresh failed or timed out (%s); will retry in background",
+                refresh_result,
+            )
+            # Don't set last_update_success to False here - let HA retry naturally
+
+        if not coordinator.last_update_success:
+            raise ConfigEntryNotReady
+
+        # Setup succeeded, resources are now owned by the entry lifecycle
+        cleanup.pop_all()
 
     _LOGGER.debug("async_setup_entry scheduling websocket renewal task")
 
     # Schedule websocket renewal as background task after HA startup completes to avoid blocking
-    # Use proper HA pattern: per-entry task with automatic cleanup via async_on_unload
-    async def start_renewal_task(event=None):
-        coordinator.renew_task = hass.async_create_task(
-            coordinator.renew_websocket(), name=f"Electrolux renewal - {entry.title}"
+    # Entry background tasks are cancelled by HA when the entry is unloaded/reloaded
+    @callback
+    def start_renewal_task(_hass: HomeAssistant) -> None:
+        coordinator.renew_task = entry.async_create_background_task(
+            hass,
+            coordinator.renew_websocket(),
+            f"Electrolux renewal - {entry.title}",
+            eager_start=True,
         )
 
-        # Bind task cleanup to entry lifecycle - ensures task is cancelled when entry is unloaded/reloaded
-        def cleanup_task():
-            if coordinator.renew_task:
-                coordinator.renew_task.cancel()
-
-        entry.async_on_unload(cleanup_task)
-
-    # Start renewal task after HA has fully started to prevent blocking startup
-    entry.async_on_unload(
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_renewal_task)
-    )
+    # Start renewal task after HA has fully started to prevent blocking startup,
+    # or right away when the entry is set up (or reloaded) on a running instance
+    entry.async_on_unload(async_at_started(hass, start_renewal_task))
 
     async def _close_coordinator(event):
         """Close coordinator resources on HA shutdown."""
+        # close_websocket() also closes the API client, so there is nothing to gather here
         try:
             await coordinator.close_websocket()
+        except asyncio.CancelledError:
+            # Never swallow cancellation, let shutdown propagate it
+            raise
         except Exception as ex:
             _LOGGER.debug("Error during HA shutdown cleanup: %s", ex)
 
@@ -144,21 +209,41 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # 1. Retrieve the client before data is cleared
     coordinator: ElectroluxCoordinator = hass.data[DOMAIN].get(entry.entry_id)
     client = coordinator.api if coordinator else None
+    # Stop the coordinator's own tasks, they must not reach the kept client
+    if coordinator:
+        await coordinator.cancel_pending_tasks()
+
+    # 2. Proceed with standard HA unloading while the client stops its SSE stream
+    # alongside it - both touch disjoint state
+    unload_result: Any
+    release_result: Any
+    unload_result, release_result = await asyncio.gather(
+        hass.config_entries.async_unload_platforms(entry, PLATFORMS),
+        client.release() if client else asyncio.sleep(0),
+        return_exceptions=True,
+    )
+    if isinstance(release_result, Exception):
+        _LOGGER.debug(
+            "Electrolux error releasing API client on unload: %s", release_result
+        )
+    if isinstance(unload_result, BaseException):
+        raise unload_result
 
-    # 2. Trigger the decisive cleanup in util.py
-    if client:
-        await client.close()
-
-    # 3. Proceed with standard HA unloading
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = unload_result is True
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        # 3. Keep the client for the next setup of this entry
+        if client:
+            hass.data[DOMAIN].setdefault(CLIENT_CACHE, {})[entry.entry_id] = (
+                client.credentials,
+                client,
+            )
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    _LOGGER.debug("Electrolux async_reload_entry %s", entry)
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the cached client of a removed entry."""
+    cached = hass.data.get(DOMAIN, {}).get(CLIENT_CACHE, {}).pop(entry.entry_id, None)
+    if cached:
+        await cached[1].close()
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, TypedDict
+from functools import cached_property
+from typing import Any, NamedTuple, TypedDict
 
 from homeassistant.components.number import NumberDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass
@@ -50,6 +51,19 @@ def deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str,
     return result
 
 
+class EntityDetails(NamedTuple):
+    """Everything get_entity needs to know about a capability from the API data."""
+
+    entity_type: Platform | None
+    entity_name: str
+    entity_attr: str
+    category: str
+    capability: dict[str, Any] | None
+    device_class: Any
+    unit: str | None
+    display_name: str
+
+
 class ElectroluxLibraryEntity:
     """Electrolux Library Entity."""
 
@@ -79,6 +93,24 @@ class ElectroluxLibraryEntity:
         """Return the reported state of the appliance."""
         return self.state.get("properties", {}).get("reported")
 
+    @cached_property
+    def triggers_by_attr(self) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+        """Index the capability triggers by the attributes their action affects.
+
+        Built on first use, once setup has added the static capabilities.
+        """
+        index: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        for cap_name, cap_def in (self.capabilities or {}).items():
+            if not isinstance(cap_def, dict):
+                continue
+            for trigger in cap_def.get("triggers") or ():
+                if isinstance(trigger, dict) and isinstance(
+                    action := trigger.get("action"), dict
+                ):
+                    for attr_name in action:
+                        index.setdefault(attr_name, []).append((cap_name, trigger))
+        return index
+
     def get_name(self) -> str:
         """Get entity name."""
         return self.name
@@ -181,9 +213,27 @@ class ElectroluxLibraryEntity:
 
         return result if isinstance(result, dict) else None
 
+    def get_entity_details(self, attr_name: str) -> EntityDetails:
+        """Resolve all entity details of a capability with one capability lookup."""
+        capability_def = self.get_capability(attr_name)
+        return EntityDetails(
+            entity_type=self._entity_type(attr_name, capability_def),
+            entity_name=self.get_entity_name(attr_name),
+            entity_attr=self.get_entity_attr(attr_name),
+            category=self.get_category(attr_name),
+            capability=capability_def,
+            device_class=self._entity_device_class(capability_def),
+            unit=self._entity_unit(capability_def),
+            display_name=self.get_sensor_name(attr_name),
+        )
+
     def get_entity_unit(self, attr_name: str) -> str | None:
         """Get entity unit type."""
-        capability_def = self.get_capability(attr_name)
+        return self._entity_unit(self.get_capability(attr_name))
+
+    @staticmethod
+    def _entity_unit(capability_def: dict[str, Any] | None) -> str | None:
+        """Get the unit for a capability definition."""
         if not capability_def:
             return None
         # Type : string, int, number, boolean (other values ignored)
@@ -196,7 +246,11 @@ class ElectroluxLibraryEntity:
 
     def get_entity_device_class(self, attr_name: str) -> Any:
         """Get entity device class."""
-        capability_def: dict[str, Any] | None = self.get_capability(attr_name)
+        return self._entity_device_class(self.get_capability(attr_name))
+
+    @staticmethod
+    def _entity_device_class(capability_def: dict[str, Any] | None) -> Any:
+        """Get the device class for a capability definition."""
         if not capability_def:
             return None
         # Type : string, int, number, boolean (other values ignored)
@@ -211,8 +265,12 @@ class ElectroluxLibraryEntity:
 
     def get_entity_type(self, attr_name: str) -> Platform | None:
         """Get entity type."""
+        return self._entity_type(attr_name, self.get_capability(attr_name))
 
-        capability_def: dict[str, Any] | None = self.get_capability(attr_name)
+    def _entity_type(
+        self, attr_name: str, capability_def: dict[str, Any] | None
+    ) -> Platform | None:
+        """Get the entity type for a capability definition."""
         if not capability_def:
             return None
 
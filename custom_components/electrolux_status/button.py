@@ -32,9 +32,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == BUTTON
-            ]
+            entities = appliance.entities_by_type.get(BUTTON, [])
             _LOGGER.debug(
                 "Electrolux add %d BUTTON entities to registry for appliance %s",
                 len(entities),
@@ -195,7 +193,10 @@ class ElectroluxButton(ElectroluxEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Execute a button press."""
         await self.send_command()
-        await self.coordinator.async_request_refresh()
+        # The command result arrives over the websocket, only confirm in the background
+        self.coordinator.hass.async_create_task(
+            self.coordinator.async_request_refresh()
+        )
         # await self.hass.async_add_executor_job(self.send_command)
         # if self.entity_attr == "ExecuteCommand":
         #     await self.hass.async_add_executor_job(self.coordinator.api.setHacl, self.get_appliance.pnc_id, "0x0403", self.val_to_send, self.entity_source)
@@ -1,148 +1,244 @@
 """Defined catalog of entities for basic entities (common across all appliance types)."""
 
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from threading import Lock
+from types import MappingProxyType
+
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import UnitOfTime
 from homeassistant.helpers.entity import EntityCategory
 
-from .catalog_oven import CATALOG_OVEN
-from .catalog_purifier import A9
-from .catalog_refrigerator import CATALOG_REFRIGERATOR, EHE6899SA
-from .catalog_washer import CATALOG_WASHER
-from .model import ElectroluxDevice
+from .model import ElectroluxDevice, enum_values
+
+
+class _LazyCatalogs(Mapping[str, Mapping[str, ElectroluxDevice]]):
+    """Catalogs imported from their module on first access.
+
+    Only the catalogs for appliances actually present are ever built. Catalogs
+    are built in executor threads, the lock keeps one instance per key.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, tuple[str, str]],
+        base: Mapping[str, ElectroluxDevice] | None = None,
+    ) -> None:
+        """Initialize with the (module, attribute) source of each catalog."""
+        self._sources = sources
+        self._base = base
+        self._loaded: dict[str, Mapping[str, ElectroluxDevice]] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, key: str) -> Mapping[str, ElectroluxDevice]:
+        """Return the catalog, importing it on first access."""
+        if (catalog := self._loaded.get(key)) is not None:
+            return catalog
+        with self._lock:
+            if (catalog := self._loaded.get(key)) is None:
+                module, attr = self._sources[key]
+                catalog = getattr(import_module(f".{module}", __package__), attr)
+                if self._base is not None:
+                    catalog = MappingProxyType({**self._base, **catalog})
+                self._loaded[key] = catalog
+        return catalog
+
+    def __contains__(self, key: object) -> bool:
+        """Check membership without importing anything."""
+        return key in self._sources
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the known keys without importing anything."""
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        """Return the number of known catalogs."""
+        return len(self._sources)
+
 
 # definitions of model explicit overrides. These will be used to
 # create a new catalog with a merged definition of properties
-CATALOG_MODEL: dict[str, dict[str, ElectroluxDevice]] = {
-    "EHE6899SA": EHE6899SA,
-    "A9": A9,
-}
+_MODEL_SOURCES: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "EHE6899SA": ("catalog_refrigerator", "EHE6899SA"),
+        "A9": ("catalog_purifier", "A9"),
+    }
+)
 
 # Appliance type catalogs
-CATALOG_BY_TYPE: dict[str, dict[str, ElectroluxDevice]] = {
-    "OV": CATALOG_OVEN,  # Oven
-    "CR": CATALOG_REFRIGERATOR,  # Refrigerator
-    "WM": CATALOG_WASHER,  # Washing Machine
-    # Add more appliance types as needed
-}
-
-CATALOG_BASE: dict[str, ElectroluxDevice] = {
-    "alerts": ElectroluxDevice(
-        capability_info={"access": "read", "type": "alert"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:alert",
-    ),
-    "applianceMode": ElectroluxDevice(
-        capability_info={
-            "access": "read",
-            "type": "string",
-            "values": {"DEMO": {}, "NORMAL": {}, "SERVICE": {}},
-        },
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:auto-mode",
-        entity_registry_enabled_default=False,
-    ),
-    "applianceState": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:state-machine",
-        entity_registry_enabled_default=False,
-    ),
-    "applianceTotalWorkingTime": ElectroluxDevice(
-        capability_info={"access": "read", "type": "number"},
-        device_class=SensorDeviceClass.DURATION,
-        unit=UnitOfTime.SECONDS,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:timelapse",
-    ),
-    "connectionState": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:wifi",
-    ),
-    "networkInterface/linkQualityIndicator": ElectroluxDevice(
-        capability_info={
-            "access": "read",
-            "type": "string",
-            "values": {
-                "EXCELLENT": {},
-                "GOOD": {},
-                "POOR": {},
-                "UNDEFINED": {},
-                "VERY_GOOD": {},
-                "VERY_POOR": {},
+_TYPE_SOURCES: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "OV": ("catalog_oven", "CATALOG_OVEN"),  # Oven
+        "CR": ("catalog_refrigerator", "CATALOG_REFRIGERATOR"),  # Refrigerator
+        "WM": ("catalog_washer", "CATALOG_WASHER"),  # Washing Machine
+        # Add more appliance types as needed
+    }
+)
+
+# Appliance types with a dedicated catalog, other types only get CATALOG_BASE
+SUPPORTED_APPLIANCE_TYPES: frozenset[str] = frozenset(_TYPE_SOURCES)
+
+CATALOG_MODEL: Mapping[str, Mapping[str, ElectroluxDevice]] = _LazyCatalogs(
+    _MODEL_SOURCES
+)
+CATALOG_BY_TYPE: Mapping[str, Mapping[str, ElectroluxDevice]] = _LazyCatalogs(
+    _TYPE_SOURCES
+)
+
+CATALOG_BASE: Mapping[str, ElectroluxDevice] = MappingProxyType(
+    {
+        "alerts": ElectroluxDevice(
+            capability_info={"access": "read", "type": "alert"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:alert",
+        ),
+        "applianceMode": ElectroluxDevice(
+            capability_info={
+                "access": "read",
+                "type": "string",
+                "values": enum_values("DEMO", "NORMAL", "SERVICE"),
+            },
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:auto-mode",
+            entity_registry_enabled_default=False,
+        ),
+        "applianceState": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:state-machine",
+            entity_registry_enabled_default=False,
+        ),
+        "applianceTotalWorkingTime": ElectroluxDevice(
+            capability_info={"access": "read", "type": "number"},
+            device_class=SensorDeviceClass.DURATION,
+            unit=UnitOfTime.SECONDS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:timelapse",
+        ),
+        "connectionState": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:wifi",
+        ),
+        "networkInterface/linkQualityIndicator": ElectroluxDevice(
+            capability_info={
+                "access": "read",
+                "type": "string",
+                "values": enum_values(
+                    "EXCELLENT", "GOOD", "POOR", "UNDEFINED", "VERY_GOOD", "VERY_POOR"
+                ),
+            },
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:wifi",
+        ),
+        "networkInterface/niuSwUpdateCurrentDescription": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:update",
+            entity_registry_enabled_default=False,
+        ),
+        "networkInterface/otaState": ElectroluxDevice(
+            capability_info={
+                "access": "read",
+                "type": "string",
+                "values": enum_values(
+                    "DESCRIPTION_AVAILABLE",
+                    "DESCRIPTION_DOWNLOADING",
+                    "DESCRIPTION_READY",
+                    "FW_DOWNLOADING",
+                    "FW_DOWNLOAD_START",
+                    "FW_SIGNATURE_CHECK",
+                    "FW_UPDATE_IN_PROGRESS",
+                    "IDLE",
+                    "READY_TO_UPDATE",
+                    "UPDATE_ABORT",
+                    "UPDATE_ERROR",
+                    "UPDATE_OK",
+                    "WAITINGFORAUTHORIZATION",
+                ),
             },
-        },
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:wifi",
-    ),
-    "networkInterface/niuSwUpdateCurrentDescription": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:update",
-        entity_registry_enabled_default=False,
-    ),
-    "networkInterface/otaState": ElectroluxDevice(
-        capability_info={
-            "access": "read",
-            "type": "string",
-            "values": {
-                "DESCRIPTION_AVAILABLE": {},
-                "DESCRIPTION_DOWNLOADING": {},
-                "DESCRIPTION_READY": {},
-                "FW_DOWNLOADING": {},
-                "FW_DOWNLOAD_START": {},
-                "FW_SIGNATURE_CHECK": {},
-                "FW_UPDATE_IN_PROGRESS": {},
-                "IDLE": {},
-                "READY_TO_UPDATE": {},
-                "UPDATE_ABORT": {},
-                "UPDATE_ERROR": {},
-                "UPDATE_OK": {},
-                "WAITINGFORAUTHORIZATION": {},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:update",
+        ),
+        "networkInterface/startUpCommand": ElectroluxDevice(
+            capability_info={
+                "access": "write",
+                "type": "string",
+                "values": enum_values("UNINSTALL"),
             },
-        },
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:update",
-    ),
-    "networkInterface/startUpCommand": ElectroluxDevice(
-        capability_info={
-            "access": "write",
-            "type": "string",
-            "values": {"UNINSTALL": {}},
-        },
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.CONFIG,
-        entity_icon="mdi:restart",
-        entity_registry_enabled_default=False,
-    ),
-    "networkInterface/swAncAndRevision": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:information",
-        entity_registry_enabled_default=False,
-    ),
-    "networkInterface/swVersion": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:information",
-    ),
-}
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.CONFIG,
+            entity_icon="mdi:restart",
+            entity_registry_enabled_default=False,
+        ),
+        "networkInterface/swAncAndRevision": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:information",
+            entity_registry_enabled_default=False,
+        ),
+        "networkInterface/swVersion": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:information",
+        ),
+    }
+)
+
+
+# Base catalog merged with each appliance-type catalog, so an appliance
+# resolves any of its entries with a single lookup
+CATALOG_BY_TYPE_MERGED: Mapping[str, Mapping[str, ElectroluxDevice]] = _LazyCatalogs(
+    _TYPE_SOURCES, base=CATALOG_BASE
+)
+
+
+# Catalogs with model overrides applied, shared by appliances of the same model
+_MODEL_CATALOGS: dict[tuple[str | None, str], Mapping[str, ElectroluxDevice]] = {}
+# get_catalog runs in executor threads, one job per appliance
+_MODEL_CATALOGS_LOCK = Lock()
+
+
+def get_catalog(
+    appliance_type: str | None, model: str | None
+) -> Mapping[str, ElectroluxDevice]:
+    """Return the merged, read-only catalog for an appliance type and model.
+
+    Catalog modules are imported on first use and imports block, so the first
+    call for an appliance is meant to run in the executor.
+    """
+    catalog = (
+        CATALOG_BY_TYPE_MERGED[appliance_type]
+        if appliance_type in SUPPORTED_APPLIANCE_TYPES
+        else CATALOG_BASE
+    )
+    if model is None or model not in CATALOG_MODEL:
+        return catalog
+
+    key = (appliance_type, model)
+    if (model_catalog := _MODEL_CATALOGS.get(key)) is not None:
+        return model_catalog
+    with _MODEL_CATALOGS_LOCK:
+        if (model_catalog := _MODEL_CATALOGS.get(key)) is None:
+            model_catalog = MappingProxyType({**catalog, **CATALOG_MODEL[model]})
+            _MODEL_CATALOGS[key] = model_catalog
+    return model_catalog
@@ -1,153 +1,160 @@
 """Defined catalog of entities for refrigerator type devices."""
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.helpers.entity import EntityCategory
 
-from .model import ElectroluxDevice
+from .model import CLOSED_OPEN_VALUES, OFF_ON_VALUES, ElectroluxDevice
 
-CATALOG_REFRIGERATOR: dict[str, ElectroluxDevice] = {
-    "freezer/alerts": ElectroluxDevice(
-        capability_info={"access": "read", "type": "alert"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:alert",
-    ),
-    "freezer/applianceState": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "freezer/doorState": ElectroluxDevice(
-        capability_info={
-            "access": "read",
-            "type": "string",
-            "values": {"CLOSED": {}, "OPEN": {}},
-        },
-        device_class=BinarySensorDeviceClass.DOOR,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "freezer/fastMode": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "type": "string",
-            "values": {"OFF": {}, "ON": {}},
-        },
-        device_class=SwitchDeviceClass.SWITCH,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "freezer/fastModeTimeToEnd": ElectroluxDevice(
-        capability_info={"access": "read", "type": "number"},
-        device_class=SensorDeviceClass.DURATION,
-        unit=UnitOfTime.SECONDS,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "freezer/targetTemperatureC": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "default": -18.0,
-            "max": -13.0,
-            "min": -24.0,
-            "step": 1.0,
-            "type": "temperature",
-        },
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit=UnitOfTemperature.CELSIUS,
-        entity_category=None,
-        entity_icon="mdi:thermometer",
-    ),
-    "fridge/alerts": ElectroluxDevice(
-        capability_info={"access": "read", "type": "alert"},
-        device_class=None,
-        unit=None,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:alert",
-    ),
-    "fridge/applianceState": ElectroluxDevice(
-        capability_info={"access": "read", "type": "string"},
-        device_class=None,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "fridge/doorState": ElectroluxDevice(
-        capability_info={
-            "access": "read",
-            "type": "string",
-            "values": {"CLOSED": {}, "OPEN": {}},
-        },
-        device_class=BinarySensorDeviceClass.DOOR,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "fridge/fastMode": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "type": "string",
-            "values": {"OFF": {}, "ON": {}},
-        },
-        device_class=SwitchDeviceClass.SWITCH,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "fridge/fastModeTimeToEnd": ElectroluxDevice(
-        capability_info={"access": "read", "type": "number"},
-        device_class=SensorDeviceClass.DURATION,
-        unit=UnitOfTime.SECONDS,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_icon="mdi:fridge-variant",
-    ),
-    "fridge/targetTemperatureC": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "default": 4.0,
-            "max": 8.0,
-            "min": 2.0,
-            "step": 1.0,
-            "type": "temperature",
-        },
-        device_class=SensorDeviceClass.TEMPERATURE,
-        unit=UnitOfTemperature.CELSIUS,
-        entity_category=None,
-        entity_icon="mdi:thermometer",
-    ),
-}
+CATALOG_REFRIGERATOR: Mapping[str, ElectroluxDevice] = MappingProxyType(
+    {
+        "freezer/alerts": ElectroluxDevice(
+            capability_info={"access": "read", "type": "alert"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:alert",
+        ),
+        "freezer/applianceState": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "freezer/doorState": ElectroluxDevice(
+            capability_info={
+                "access": "read",
+                "type": "string",
+                "values": CLOSED_OPEN_VALUES,
+            },
+            device_class=BinarySensorDeviceClass.DOOR,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "freezer/fastMode": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "type": "string",
+                "values": OFF_ON_VALUES,
+            },
+            device_class=SwitchDeviceClass.SWITCH,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "freezer/fastModeTimeToEnd": ElectroluxDevice(
+            capability_info={"access": "read", "type": "number"},
+            device_class=SensorDeviceClass.DURATION,
+            unit=UnitOfTime.SECONDS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "freezer/targetTemperatureC": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "default": -18.0,
+                "max": -13.0,
+                "min": -24.0,
+                "step": 1.0,
+                "type": "temperature",
+            },
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit=UnitOfTemperature.CELSIUS,
+            entity_category=None,
+            entity_icon="mdi:thermometer",
+        ),
+        "fridge/alerts": ElectroluxDevice(
+            capability_info={"access": "read", "type": "alert"},
+            device_class=None,
+            unit=None,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:alert",
+        ),
+        "fridge/applianceState": ElectroluxDevice(
+            capability_info={"access": "read", "type": "string"},
+            device_class=None,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "fridge/doorState": ElectroluxDevice(
+            capability_info={
+                "access": "read",
+                "type": "string",
+                "values": CLOSED_OPEN_VALUES,
+            },
+            device_class=BinarySensorDeviceClass.DOOR,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "fridge/fastMode": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "type": "string",
+                "values": OFF_ON_VALUES,
+            },
+            device_class=SwitchDeviceClass.SWITCH,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "fridge/fastModeTimeToEnd": ElectroluxDevice(
+            capability_info={"access": "read", "type": "number"},
+            device_class=SensorDeviceClass.DURATION,
+            unit=UnitOfTime.SECONDS,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_icon="mdi:fridge-variant",
+        ),
+        "fridge/targetTemperatureC": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "default": 4.0,
+                "max": 8.0,
+                "min": 2.0,
+                "step": 1.0,
+                "type": "temperature",
+            },
+            device_class=SensorDeviceClass.TEMPERATURE,
+            unit=UnitOfTemperature.CELSIUS,
+            entity_category=None,
+            entity_icon="mdi:thermometer",
+        ),
+    }
+)
 
-EHE6899SA = {
-    "uiLockMode": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "type": "boolean",
-            "values": {"OFF": {}, "ON": {}},
-        },
-        device_class=SwitchDeviceClass.SWITCH,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:lock",
-        friendly_name="Child Lock Internal",
-    ),
-    "ui2LockMode": ElectroluxDevice(
-        capability_info={
-            "access": "readwrite",
-            "type": "boolean",
-            "values": {"OFF": {}, "ON": {}},
-        },
-        device_class=SwitchDeviceClass.SWITCH,
-        unit=None,
-        entity_category=None,
-        entity_icon="mdi:lock",
-        friendly_name="Child Lock External",
-    ),
-}
+EHE6899SA: Mapping[str, ElectroluxDevice] = MappingProxyType(
+    {
+        "uiLockMode": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "type": "boolean",
+                "values": OFF_ON_VALUES,
+            },
+            device_class=SwitchDeviceClass.SWITCH,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:lock",
+            friendly_name="Child Lock Internal",
+        ),
+        "ui2LockMode": ElectroluxDevice(
+            capability_info={
+                "access": "readwrite",
+                "type": "boolean",
+                "values": OFF_ON_VALUES,
+            },
+            device_class=SwitchDeviceClass.SWITCH,
+            unit=None,
+            entity_category=None,
+            entity_icon="mdi:lock",
+            friendly_name="Child Lock External",
+        ),
+    }
+)
@@ -1,10 +1,15 @@
 """Electrolux status integration."""
 
 import asyncio
+import functools
 import json
 import logging
+import math
+import random
+import re
+import time
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import (
@@ -14,6 +19,7 @@ from homeassistant.exceptions import (
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ElectroluxLibraryEntity
+from .catalog_core import get_catalog
 from .const import DOMAIN, TIME_ENTITIES_TO_UPDATE
 from .models import Appliance, Appliances, ApplianceState
 from .util import ElectroluxApiClient
@@ -29,8 +35,10 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 # API Timeouts:
 # - APPLIANCE_STATE_TIMEOUT: Max time to wait for appliance state
 # - APPLIANCE_CAPABILITY_TIMEOUT: Max time to wait for capabilities
-# - SETUP_TIMEOUT_TOTAL: Total timeout for all appliances during setup
+# - SETUP_TIMEOUT_TOTAL: Total timeout for each round of appliances during setup
 # - UPDATE_TIMEOUT: Timeout for background state updates
+# - MAX_CONCURRENT_REQUESTS: Appliances queried at once during setup and
+#   refresh, so large accounts don't open a connection per appliance
 #
 # Deferred Update Configuration:
 # - DEFERRED_UPDATE_DELAY: Delay before checking appliance state after
@@ -38,6 +46,15 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 # - TIME_ENTITY_THRESHOLD_HIGH: Trigger deferred update when time
 #   remaining is below this threshold
 #
+# SSE Update Coalescing:
+# - UPDATE_DEBOUNCE_DELAY: Window in which SSE frames are collected before
+#   listeners are notified once for all of them
+#
+# Websocket Renewal Backoff:
+# - WEBSOCKET_BACKOFF_DELAY: First backoff after repeated renewal failures,
+#   doubled for every further failure up to WEBSOCKET_BACKOFF_MAX
+# - Each backoff is jittered by +/-50% so accounts don't reconnect in step
+#
 # Cleanup:
 # - CLEANUP_INTERVAL: How often to check for removed appliances
 
@@ -46,19 +63,56 @@ APPLIANCE_STATE_TIMEOUT = 8.0  # seconds
 APPLIANCE_CAPABILITY_TIMEOUT = 8.0  # seconds
 SETUP_TIMEOUT_TOTAL = 30.0  # seconds
 UPDATE_TIMEOUT = 10.0  # seconds
-FIRST_REFRESH_TIMEOUT = 15.0  # seconds for initial setup refresh
+FIRST_REFRESH_TIMEOUT = 15.0  # seconds per round of appliances for initial refresh
 DEFERRED_UPDATE_DELAY = 70  # seconds
-DEFERRED_TASK_LIMIT = 5  # maximum concurrent deferred tasks
 CLEANUP_INTERVAL = 86400  # 24 hours in seconds
 TASK_CANCEL_TIMEOUT = 2.0  # seconds for task cancellation timeouts
 WEBSOCKET_DISCONNECT_TIMEOUT = 5.0  # seconds for websocket disconnect
 WEBSOCKET_BACKOFF_DELAY = 300  # 5 minutes in seconds for backoff
+WEBSOCKET_BACKOFF_MAX = 3600  # 1 hour cap for the backoff before jitter
+WEBSOCKET_MAX_CONSECUTIVE_FAILURES = 5  # renewal failures before backing off
 API_DISCONNECT_TIMEOUT = 3.0  # seconds for API disconnect
+MAX_CONCURRENT_REQUESTS = 8  # appliances fetched in parallel during setup/refresh
+UPDATE_DEBOUNCE_DELAY = 0.1  # seconds to coalesce SSE frames into one update
 
 # Time entity thresholds
 TIME_ENTITY_THRESHOLD_LOW = 0
 TIME_ENTITY_THRESHOLD_HIGH = 1  # seconds
 
+# Set form of TIME_ENTITIES_TO_UPDATE for the per-frame lookups in incoming_data
+_TIME_ENTITIES = frozenset(TIME_ENTITIES_TO_UPDATE)
+
+# Envelope keys of a bulk SSE frame that are not appliance properties
+_SSE_META_KEYS = frozenset(("applianceId", "appliance_id", "userId", "timestamp"))
+
+# Error messages treated as authentication failures, matched case-insensitively
+_AUTH_ERROR_RE = re.compile(
+    r"401|unauthorized|auth|token|invalid grant|forbidden", re.IGNORECASE
+)
+_UPDATE_AUTH_ERROR_RE = re.compile(r"401|unauthorized|auth|token", re.IGNORECASE)
+
+
+def is_cycle_ending(reported_data: dict[str, Any]) -> bool:
+    """Return whether a time entity in the data says the cycle is about to end."""
+    # Only the time entities present in the data are looked at
+    return any(
+        (value := reported_data[key]) is not None
+        and TIME_ENTITY_THRESHOLD_LOW < value <= TIME_ENTITY_THRESHOLD_HIGH
+        for key in reported_data.keys() & _TIME_ENTITIES
+    )
+
+
+def request_rounds(count: int) -> int:
+    """Return how many semaphore rounds it takes to query count appliances."""
+    return max(1, math.ceil(count / MAX_CONCURRENT_REQUESTS))
+
+
+def websocket_backoff_delay(consecutive_failures: int) -> float:
+    """Return the jittered backoff after consecutive_failures renewal failures."""
+    exponent = max(0, consecutive_failures - WEBSOCKET_MAX_CONSECUTIVE_FAILURES)
+    delay = min(WEBSOCKET_BACKOFF_DELAY * 2**exponent, WEBSOCKET_BACKOFF_MAX)
+    return delay * (0.5 + random.random())
+
 
 class ElectroluxCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -78,12 +132,17 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         self.platforms: list[str] = []
         self.renew_task: Optional[asyncio.Task] = None
         self.renew_interval = renew_interval
-        self._deferred_tasks: set = set()  # Track deferred update tasks
         self._deferred_tasks_by_appliance: dict[str, asyncio.Task] = (
             {}
         )  # Track deferred tasks by appliance
-        self._appliances_lock = asyncio.Lock()  # Shared lock for appliances dict
-        self._last_cleanup_time = 0  # Track when we last ran appliance cleanup
+        # Same container as self.data["appliances"], read directly on every SSE frame
+        self._appliances: Appliances | None = None
+        # Bounds per-appliance API fan-out in setup_entities and _async_update_data
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._last_cleanup_time = 0.0  # Track when we last ran appliance cleanup
+        self._closed = False  # Set once close_websocket has run
+        # Pending listener notification for SSE frames, see _schedule_flush
+        self._flush_handle: asyncio.TimerHandle | None = None
 
         super().__init__(
             hass,
@@ -94,6 +153,13 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             ),  # Health check every 6 hours instead of 30 seconds
         )
 
+    @property
+    def first_refresh_timeout(self) -> float:
+        """Return the first refresh budget for the appliances set up so far."""
+        appliances: Appliances | None = (self.data or {}).get("appliances")
+        count = len(appliances.get_appliances()) if appliances else 0
+        return FIRST_REFRESH_TIMEOUT * request_rounds(count)
+
     async def async_login(self) -> bool:
         """Authenticate with the service."""
         try:
@@ -116,18 +182,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         This method should be called when authentication errors are detected
         during command execution or other API calls outside the normal update cycle.
         """
-        error_msg = str(exception).lower()
-        if any(
-            keyword in error_msg
-            for keyword in [
-                "401",
-                "unauthorized",
-                "auth",
-                "token",
-                "invalid grant",
-                "forbidden",
-            ]
-        ):
+        if _AUTH_ERROR_RE.search(str(exception)):
             _LOGGER.warning("Authentication failed during operation: %s", exception)
             raise ConfigEntryAuthFailed(
                 "Token expired or invalid - please reauthenticate"
@@ -138,6 +193,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         _LOGGER.debug(
             "Electrolux scheduling deferred update for appliance %s", appliance_id
         )
+        scheduled_at = time.monotonic()
         await asyncio.sleep(delay)
         _LOGGER.debug(
             "Electrolux scheduled deferred update for appliance %s running",
@@ -148,6 +204,18 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             return
         try:
             appliance: Appliance = appliances.get_appliance(appliance_id)
+            if (
+                appliance
+                and appliance.last_update_ts > scheduled_at
+                and not is_cycle_ending(appliance.reported_state)
+            ):
+                # Newer data moved the time past the cycle end, no need to ask for it
+                # Unrelated frames (door, link quality, ...) do not count
+                _LOGGER.debug(
+                    "Electrolux deferred update for appliance %s skipped, cycle end already reported",
+                    appliance_id,
+                )
+                return
             if appliance:
                 appliance_status = await self.api.get_appliance_state(appliance_id)
                 appliance.update(appliance_status)
@@ -178,15 +246,15 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         """Process incoming data."""
         _LOGGER.debug("Electrolux appliance state updated")
         # Update reported data
-        appliances: Any = self.data.get("appliances", None)
-        if not appliances:
+        appliances = self._appliances
+        if appliances is None:
             _LOGGER.warning("No appliances data available for incoming data update")
             return
 
         # Handle incremental updates: {"applianceId": "...", "property": "...", "value": "..."}
         if data and "applianceId" in data and "property" in data and "value" in data:
             appliance_id = data["applianceId"]
-            appliance = appliances.get_appliance(appliance_id)
+            appliance = appliances.appliances.get(appliance_id)
             if appliance is None:
                 _LOGGER.warning(
                     "Received incremental data for unknown appliance %s, ignoring",
@@ -195,7 +263,9 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 return
 
             try:
-                appliance.update_reported_data({data["property"]: data["value"]})
+                changed = appliance.update_reported_data(
+                    {data["property"]: data["value"]}
+                )
             except (KeyError, ValueError, TypeError) as ex:
                 _LOGGER.error(
                     "Data validation error updating incremental data for appliance %s: %s",
@@ -210,44 +280,14 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 )
                 return
 
-            self.async_set_updated_data(self.data)
+            if changed:
+                self._schedule_flush()
 
             # Check for deferred update due to Electrolux bug: no data sent when appliance cycle is over
-            appliance_data = {data["property"]: data["value"]}
-            do_deferred = False
-            for key, value in appliance_data.items():
-                if key in TIME_ENTITIES_TO_UPDATE:
-                    if (
-                        value is not None
-                        and TIME_ENTITY_THRESHOLD_LOW
-                        < value
-                        <= TIME_ENTITY_THRESHOLD_HIGH
-                    ):
-                        do_deferred = True
-                        break
-            if do_deferred:
-                # Cancel existing deferred task for this appliance if any
-                if appliance_id in self._deferred_tasks_by_appliance:
-                    old_task = self._deferred_tasks_by_appliance[appliance_id]
-                    if not old_task.done():
-                        _LOGGER.debug(
-                            "Cancelling existing deferred update for %s", appliance_id
-                        )
-                        old_task.cancel()
-
-                # Create new deferred task
-                task = self.hass.async_create_task(
-                    self.deferred_update(appliance_id, DEFERRED_UPDATE_DELAY)
+            if data["property"] in _TIME_ENTITIES:
+                self._schedule_deferred_update(
+                    appliance_id, {data["property"]: data["value"]}
                 )
-                self._deferred_tasks_by_appliance[appliance_id] = task
-
-                # Cleanup callback
-                def cleanup_deferred(t: asyncio.Task) -> None:
-                    """Remove task from tracking when done."""
-                    if self._deferred_tasks_by_appliance.get(appliance_id) == t:
-                        del self._deferred_tasks_by_appliance[appliance_id]
-
-                task.add_done_callback(cleanup_deferred)
             return
 
         # Handle bulk updates: {"appliance_id1": {...}, "appliance_id2": {...}}
@@ -257,7 +297,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("No applianceId found in SSE data: %s", data)
             return
 
-        appliance = appliances.get_appliance(appliance_id)
+        appliance = appliances.appliances.get(appliance_id)
         if appliance is None:
             _LOGGER.warning(
                 "Received data for unknown appliance %s, ignoring", appliance_id
@@ -268,14 +308,10 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         appliance_data = data.get("data") or data.get("state") or data
         if appliance_data == data:
             # If no specific data field, assume the whole payload except applianceId is the data
-            appliance_data = {
-                k: v
-                for k, v in data.items()
-                if k not in ["applianceId", "appliance_id", "userId", "timestamp"]
-            }
+            appliance_data = {k: v for k, v in data.items() if k not in _SSE_META_KEYS}
 
         try:
-            appliance.update_reported_data(appliance_data)
+            changed = appliance.update_reported_data(appliance_data)
         except (KeyError, ValueError, TypeError) as ex:
             _LOGGER.error(
                 "Data validation error updating reported data for appliance %s: %s",
@@ -290,31 +326,60 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             )
             return
 
-        self.async_set_updated_data(self.data)
+        if changed:
+            self._schedule_flush()
 
         # Check for deferred update due to Electrolux bug: no data sent when appliance cycle is over
-        do_deferred = False
-        for key, value in appliance_data.items():
-            if key in TIME_ENTITIES_TO_UPDATE:
-                if (
-                    value is not None
-                    and TIME_ENTITY_THRESHOLD_LOW < value <= TIME_ENTITY_THRESHOLD_HIGH
-                ):
-                    do_deferred = True
-                    break
-        if do_deferred:
-            # Limit deferred tasks to prevent pile-up (max 5 concurrent)
-            if len(self._deferred_tasks) < DEFERRED_TASK_LIMIT:
-                task = self.hass.async_create_task(
-                    self.deferred_update(appliance_id, DEFERRED_UPDATE_DELAY)
-                )
-                self._deferred_tasks.add(task)
-                task.add_done_callback(self._deferred_tasks.discard)
-            else:
-                _LOGGER.debug(
-                    "Skipping deferred update for %s, too many active tasks",
-                    appliance_id,
-                )
+        self._schedule_deferred_update(appliance_id, appliance_data)
+
+    def _schedule_flush(self) -> None:
+        """Notify listeners once for the SSE frames of one debounce window."""
+        if self._flush_handle is not None:
+            return  # Already pending, this frame is picked up by it
+        self._flush_handle = self.hass.loop.call_later(
+            UPDATE_DEBOUNCE_DELAY, self._flush_update
+        )
+
+    def _flush_update(self) -> None:
+        """Push the coalesced SSE state to the listeners."""
+        self._flush_handle = None
+        self.async_set_updated_data(self.data)
+
+    def _cancel_flush(self) -> bool:
+        """Cancel a pending flush, return whether one was pending."""
+        if self._flush_handle is None:
+            return False
+        self._flush_handle.cancel()
+        self._flush_handle = None
+        return True
+
+    def _schedule_deferred_update(
+        self, appliance_id: str, appliance_data: dict[str, Any]
+    ) -> None:
+        """Schedule a deferred update when the reported time says the cycle is ending.
+
+        Only one deferred update is kept per appliance, a newer one replaces it.
+        """
+        if not is_cycle_ending(appliance_data):
+            return
+
+        # Cancel existing deferred task for this appliance if any
+        old_task = self._deferred_tasks_by_appliance.get(appliance_id)
+        if old_task and not old_task.done():
+            _LOGGER.debug("Cancelling existing deferred update for %s", appliance_id)
+            old_task.cancel()
+
+        # Create new deferred task
+        task = self.hass.async_create_task(
+            self.deferred_update(appliance_id, DEFERRED_UPDATE_DELAY)
+        )
+        self._deferred_tasks_by_appliance[appliance_id] = task
+        task.add_done_callback(functools.partial(self._cleanup_deferred, appliance_id))
+
+    def _cleanup_deferred(self, appliance_id: str, task: asyncio.Task) -> None:
+        """Remove a finished deferred task from tracking, unless it was replaced."""
+        if self._deferred_tasks_by_appliance.get(appliance_id) is task:
+            del self._deferred_tasks_by_appliance[appliance_id]
 
     async def listen_websocket(self) -> None:
         """Listen for state changes."""
@@ -342,7 +407,6 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
     async def renew_websocket(self):
         """Renew SSE event stream."""
         consecutive_failures = 0
-        max_consecutive_failures = 5
 
         while True:
             try:
@@ -355,13 +419,10 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
                 # Disconnect and reconnect with timeout
                 try:
-                    await asyncio.wait_for(
-                        self.api.disconnect_websocket(),
-                        timeout=WEBSOCKET_DISCONNECT_TIMEOUT,
-                    )
-                    await asyncio.wait_for(
-                        self.listen_websocket(), timeout=UPDATE_TIMEOUT
-                    )
+                    async with asyncio.timeout(WEBSOCKET_DISCONNECT_TIMEOUT):
+                        await self.api.disconnect_websocket()
+                    async with asyncio.timeout(UPDATE_TIMEOUT):
+                        await self.listen_websocket()
                     consecutive_failures = 0  # Reset on success
                 except asyncio.TimeoutError:
                     _LOGGER.warning("Timeout during websocket renewal")
@@ -370,13 +431,15 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("Error during websocket renewal: %s", ex)
                     consecutive_failures += 1
 
-                # If too many consecutive failures, back off
-                if consecutive_failures >= max_consecutive_failures:
+                # If too many consecutive failures, back off, longer each time
+                # until a renewal succeeds
+                if consecutive_failures >= WEBSOCKET_MAX_CONSECUTIVE_FAILURES:
+                    delay = websocket_backoff_delay(consecutive_failures)
                     _LOGGER.warning(
-                        "Too many websocket renewal failures, backing off for 5 minutes"
+                        "Too many websocket renewal failures, backing off for %d seconds",
+                        delay,
                     )
-                    await asyncio.sleep(WEBSOCKET_BACKOFF_DELAY)  # 5 minute backoff
-                    consecutive_failures = 0
+                    await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 _LOGGER.debug("Websocket renewal cancelled")
@@ -385,8 +448,12 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Electrolux renew SSE failed %s", ex)
                 consecutive_failures += 1
 
-    async def close_websocket(self):
-        """Close SSE event stream."""
+    async def cancel_pending_tasks(self) -> None:
+        """Cancel the SSE renewal, the debounced flush and the deferred updates.
+
+        The API stays open. Used on unload, where the API client is kept for the
+        next setup and must not be reached by tasks of this coordinator.
+        """
         # Cancel renewal task with shorter timeout
         if self.renew_task and not self.renew_task.done():
             self.renew_task.cancel()
@@ -395,44 +462,51 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 _LOGGER.debug("Electrolux renewal task cancelled/timeout during close")
 
-        # Cancel all deferred tasks aggressively
-        tasks_to_cancel = list(self._deferred_tasks.copy())
-        for task in tasks_to_cancel:
-            if not task.done():
-                task.cancel()
-
-        # Wait for all tasks to complete cancellation
-        if tasks_to_cancel:
-            await asyncio.gather(*tasks_to_cancel, return_exceptions=True)
-
-        self._deferred_tasks.clear()
+        self._cancel_flush()
 
         # Cancel per-appliance deferred tasks
-        appliance_tasks = list(self._deferred_tasks_by_appliance.values())
-        for task in appliance_tasks:
-            if not task.done():
-                task.cancel()
+        pending = [
+            task
+            for task in self._deferred_tasks_by_appliance.values()
+            if not task.done()
+        ]
+        for task in pending:
+            task.cancel()
 
         # Wait for cancellations
-        if appliance_tasks:
-            await asyncio.gather(*appliance_tasks, return_exceptions=True)
+        if pending:
+            await asyncio.wait(pending, timeout=TASK_CANCEL_TIMEOUT)
 
         self._deferred_tasks_by_appliance.clear()
 
+    async def close_websocket(self):
+        """Close SSE event stream."""
+        # Closing twice would only repeat the cancellations against a closed client
+        if self._closed:
+            return
+        self._closed = True
+
+        # Deliver SSE state still waiting for the debounce delay
+        if self._cancel_flush():
+            self.async_set_updated_data(self.data)
+
+        await self.cancel_pending_tasks()
+
         # Close API connection - util.py handles SSE stream cleanup
         try:
-            await asyncio.wait_for(self.api.close(), timeout=API_DISCONNECT_TIMEOUT)
-        except (asyncio.TimeoutError, Exception) as ex:
-            if isinstance(ex, asyncio.TimeoutError):
-                _LOGGER.debug("Electrolux API close timeout")
-            else:
-                _LOGGER.error("Electrolux close SSE failed %s", ex)
+            async with asyncio.timeout(API_DISCONNECT_TIMEOUT):
+                await self.api.close()
+        except TimeoutError:
+            _LOGGER.debug("Electrolux API close timeout")
+        except Exception as ex:
+            _LOGGER.error("Electrolux close SSE failed %s", ex)
 
     async def setup_entities(self):
         """Configure entities."""
         _LOGGER.debug("Electrolux setup_entities")
         appliances = Appliances({})
         self.data = {"appliances": appliances}
+        self._appliances = appliances
         try:
             appliances_list = await self.api.get_appliances_list()
             if appliances_list is None:
@@ -442,37 +516,36 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 raise ConfigEntryNotReady(
                     "Electrolux unable to retrieve appliances list. Cancelling setup"
                 )
-            _LOGGER.debug(
-                "Electrolux get_appliances_list %s %s",
-                self.api,
-                json.dumps(appliances_list),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Electrolux get_appliances_list %s %s",
+                    self.api,
+                    json.dumps(appliances_list),
+                )
 
             # Process appliances concurrently to reduce setup time
-            appliance_tasks = []
-            for appliance_json in appliances_list:
-                appliance_id = appliance_json.get("applianceId")
-                if appliance_id:
-                    task = self._setup_single_appliance(appliance_json)
-                    appliance_tasks.append(task)
-
-            # Wait for all appliance setup tasks with a global timeout
+            appliance_jsons = [
+                appliance_json
+                for appliance_json in appliances_list
+                if appliance_json.get("applianceId")
+            ]
+
+            # Wait for all appliance setup tasks with a global timeout, scaled by the
+            # number of rounds the request semaphore lets through. On timeout the
+            # task group cancels whatever is still pending before it exits.
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*appliance_tasks, return_exceptions=True),
-                    timeout=30.0,  # Total timeout for all appliances
-                )
+                async with asyncio.timeout(
+                    SETUP_TIMEOUT_TOTAL * request_rounds(len(appliance_jsons))
+                ):
+                    async with asyncio.TaskGroup() as task_group:
+                        for appliance_json in appliance_jsons:
+                            task_group.create_task(
+                                self._setup_single_appliance(appliance_json)
+                            )
             except asyncio.TimeoutError:
                 _LOGGER.warning(
-                    "Timeout setting up appliances, cancelling pending tasks"
+                    "Timeout setting up appliances, pending tasks cancelled"
                 )
-                # Cancel all pending tasks
-                for task in appliance_tasks:
-                    if not task.done():
-                        task.cancel()
-
-                # Wait for cancellations to complete
-                await asyncio.gather(*appliance_tasks, return_exceptions=True)
 
         except asyncio.CancelledError:
             _LOGGER.debug("Electrolux setup_entities cancelled")
@@ -484,6 +557,11 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
     async def _setup_single_appliance(self, appliance_json: dict[str, Any]) -> None:
         """Setup a single appliance concurrently."""
+        async with self._request_semaphore:
+            await self._setup_appliance(appliance_json)
+
+    async def _setup_appliance(self, appliance_json: dict[str, Any]) -> None:
+        """Fetch the data of a single appliance and add it to the coordinator."""
         try:
             appliance_id = appliance_json.get("applianceId")
             connection_status = appliance_json.get("connectionState")
@@ -491,58 +569,54 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 "applianceName"
             )
 
-            # Make concurrent API calls for this appliance
-            info_task = asyncio.create_task(
-                asyncio.wait_for(
-                    self.api.get_appliances_info([appliance_id]),
-                    timeout=APPLIANCE_STATE_TIMEOUT,
-                )
-            )
-            state_task = asyncio.create_task(
-                asyncio.wait_for(
-                    self.api.get_appliance_state(appliance_id),
-                    timeout=APPLIANCE_STATE_TIMEOUT,
-                )
-            )
-            capabilities_task = asyncio.create_task(
-                asyncio.wait_for(
-                    self.api.get_appliance_capabilities(appliance_id),
-                    timeout=APPLIANCE_CAPABILITY_TIMEOUT,
+            # Make concurrent API calls for this appliance, wait_for already runs
+            # each call in its own task
+            appliance_infos, appliance_state, appliance_capabilities = (
+                await asyncio.gather(
+                    asyncio.wait_for(
+                        self.api.get_appliances_info([appliance_id]),
+                        timeout=APPLIANCE_STATE_TIMEOUT,
+                    ),
+                    asyncio.wait_for(
+                        self.api.get_appliance_state(appliance_id),
+                        timeout=APPLIANCE_STATE_TIMEOUT,
+                    ),
+                    asyncio.wait_for(
+                        self.api.get_appliance_capabilities(appliance_id),
+                        timeout=APPLIANCE_CAPABILITY_TIMEOUT,
+                    ),
+                    return_exceptions=True,
                 )
             )
 
-            # Wait for info and state (required), capabilities optional
-            try:
-                appliance_infos, appliance_state = await asyncio.gather(
-                    info_task, state_task
-                )
-            except (ConnectionError, TimeoutError, asyncio.TimeoutError) as ex:
-                _LOGGER.warning(
-                    "Network error getting required data for appliance %s: %s",
-                    appliance_id,
-                    ex,
-                )
-                # Cancel the capabilities task if it hasn't completed
-                if not capabilities_task.done():
-                    capabilities_task.cancel()
-                return
-            except Exception as ex:
-                _LOGGER.warning(
-                    "Failed to get required data for appliance %s: %s", appliance_id, ex
-                )
-                # Cancel the capabilities task if it hasn't completed
-                if not capabilities_task.done():
-                    capabilities_task.cancel()
+            # Info and state are required
+            for ex in (appliance_infos, appliance_state):
+                if not isinstance(ex, BaseException):
+                    continue
+                if isinstance(
+                    ex, (ConnectionError, TimeoutError, asyncio.TimeoutError)
+                ):
+                    _LOGGER.warning(
+                        "Network error getting required data for appliance %s: %s",
+                        appliance_id,
+                        ex,
+                    )
+                else:
+                    _LOGGER.warning(
+                        "Failed to get required data for appliance %s: %s",
+                        appliance_id,
+                        ex,
+                    )
                 return
 
-            # Try to get capabilities (optional)
-            appliance_capabilities = None
-            try:
-                appliance_capabilities = await capabilities_task
-            except Exception as ex:
+            # Capabilities are optional
+            if isinstance(appliance_capabilities, BaseException):
                 _LOGGER.debug(
-                    "Could not get capabilities for appliance %s: %s", appliance_id, ex
+                    "Could not get capabilities for appliance %s: %s",
+                    appliance_id,
+                    appliance_capabilities,
                 )
+                appliance_capabilities = None
 
             # Process appliance data
             appliance_info = appliance_infos[0] if appliance_infos else None
@@ -560,8 +634,6 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 _LOGGER.error("Missing appliance_id for appliance, skipping")
                 return
 
-            from typing import cast
-
             appliance = Appliance(
                 coordinator=self,
                 pnc_id=appliance_id,
@@ -571,9 +643,13 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 state=cast(ApplianceState, appliance_state),
             )
 
-            # Thread-safe addition to appliances dict
-            async with self._appliances_lock:
-                self.data["appliances"].appliances[appliance_id] = appliance
+            # Catalogs are imported on first use, keep that import off the event loop
+            await self.hass.async_add_executor_job(
+                get_catalog, appliance.appliance_type, appliance.model
+            )
+
+            # Setup tasks all run on the event loop, a plain assignment is safe
+            self.data["appliances"].appliances[appliance_id] = appliance
 
             appliance.setup(
                 ElectroluxLibraryEntity(
@@ -610,35 +686,17 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         appliances: Appliances = self.data.get("appliances")  # type: ignore[assignment,union-attr]
         app_dict = appliances.get_appliances()
 
+        # The refresh notifies the listeners itself, covering any pending SSE flush
+        self._cancel_flush()
+
         if not app_dict:
             return self.data
 
-        async def _update_single(app_id: str, app_obj) -> bool:
-            try:
-                # Use a strict timeout for the background refresh
-                status = await asyncio.wait_for(
-                    self.api.get_appliance_state(app_id), timeout=UPDATE_TIMEOUT
-                )
-                app_obj.update(status)
-                return True  # Success
-            except asyncio.CancelledError:
-                raise
-            except Exception as ex:
-                error_msg = str(ex).lower()
-                # Check if this is an authentication error - these should still fail the update
-                if any(
-                    keyword in error_msg
-                    for keyword in ["401", "unauthorized", "auth", "token"]
-                ):
-                    _LOGGER.warning("Authentication failed during data update: %s", ex)
-                    raise ConfigEntryAuthFailed("Token expired or invalid") from ex
-                # For other errors, just log and return failure
-                _LOGGER.debug("Failed to update %s during refresh: %s", app_id, ex)
-                return False  # Failure
-
-        # Run all updates concurrently
+        # Run all updates concurrently. Every run covers every appliance, button and
+        # text entities request a refresh after a command and expect fresh state;
+        # the request semaphore is what keeps large accounts from bursting the API
         results = await asyncio.gather(
-            *(_update_single(aid, aobj) for aid, aobj in app_dict.items()),
+            *(self._update_single(aid, aobj) for aid, aobj in app_dict.items()),
             return_exceptions=True,
         )
 
@@ -679,20 +737,34 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
             )
 
         # Periodically clean up removed appliances (once per day)
-        # Check if we should run cleanup
-        if not hasattr(self, "_last_cleanup_time"):
-            self._last_cleanup_time = 0
-
-        import time
-
         current_time = time.time()
         if current_time - self._last_cleanup_time > CLEANUP_INTERVAL:  # 24 hours
             _LOGGER.debug("Running periodic appliance cleanup")
             await self.cleanup_removed_appliances()
-            self._last_cleanup_time = int(current_time)
+            self._last_cleanup_time = current_time
 
         return self.data
 
+    async def _update_single(self, app_id: str, app_obj: Appliance) -> bool:
+        """Refresh the state of one appliance, return whether it succeeded."""
+        try:
+            # Use a strict timeout for the background refresh, the wait for a
+            # semaphore slot is not counted against it
+            async with self._request_semaphore, asyncio.timeout(UPDATE_TIMEOUT):
+                status = await self.api.get_appliance_state(app_id)
+            app_obj.update(status)
+            return True  # Success
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            # Check if this is an authentication error - these should still fail the update
+            if _UPDATE_AUTH_ERROR_RE.search(str(ex)):
+                _LOGGER.warning("Authentication failed during data update: %s", ex)
+                raise ConfigEntryAuthFailed("Token expired or invalid") from ex
+            # For other errors, just log and return failure
+            _LOGGER.debug("Failed to update %s during refresh: %s", app_id, ex)
+            return False  # Failure
+
     async def cleanup_removed_appliances(self) -> None:
         """Remove appliances that no longer exist in the account."""
         try:
@@ -702,20 +774,19 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 return
 
             # Get current appliance IDs
-            current_ids = set()
-            for appliance_json in appliances_list:
-                if appliance_id := appliance_json.get("applianceId"):
-                    current_ids.add(appliance_id)
+            current_ids = {
+                appliance_id
+                for appliance_json in appliances_list
+                if (appliance_id := appliance_json.get("applianceId"))
+            }
 
             # Get appliances we're tracking
             tracked_appliances = self.data.get("appliances")
             if not tracked_appliances:
                 return
 
-            tracked_ids = set(tracked_appliances.appliances.keys())
-
-            # Find appliances that were removed
-            removed_ids = tracked_ids - current_ids
+            # Find appliances that were removed, straight from the keys view
+            removed_ids = tracked_appliances.appliances.keys() - current_ids
 
             if removed_ids:
                 _LOGGER.info(
@@ -726,7 +797,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
                 # Remove from tracking
                 for appliance_id in removed_ids:
-                    del tracked_appliances.appliances[appliance_id]
+                    tracked_appliances.appliances.pop(appliance_id, None)
 
                 # Trigger entity registry cleanup
                 self.async_set_updated_data(self.data)
@@ -3,6 +3,7 @@
 import asyncio
 import hashlib
 import logging
+from functools import cached_property
 from typing import Any, cast
 
 from homeassistant.config_entries import ConfigEntry
@@ -31,11 +32,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity
-                for entity in appliance.entities
-                if entity.entity_type == "entity"
-            ]
+            entities = appliance.entities_by_type.get("entity", [])
 
             # Filter out fPPN_ prefixed entities if a matching non-prefixed entity exists
             filtered_entities = []
@@ -269,6 +266,11 @@ class ElectroluxEntity(CoordinatorEntity):
             return self.reported_state.get(source, {}).get(attr, None)
         return self.reported_state.get(path, None)
 
+    @cached_property
+    def _is_seconds_unit(self) -> bool:
+        """Return whether the value is in seconds, shown as minutes in the UI."""
+        return self.unit == UnitOfTime.SECONDS
+
     @property
     def reported_state(self) -> dict[str, Any]:
         """Return reported state of the appliance, converting seconds to minutes for time entities."""
@@ -278,7 +280,7 @@ class ElectroluxEntity(CoordinatorEntity):
         base_state = self.appliance_status.get("properties", {}).get("reported", {})
 
         # Convert seconds to minutes for UI display when unit is SECONDS
-        if self.unit == UnitOfTime.SECONDS:
+        if self._is_seconds_unit:
             transformed_state = base_state.copy()
             raw_seconds = base_state.get(self.entity_attr)
             if raw_seconds is not None and isinstance(raw_seconds, (int, float)):
@@ -466,14 +468,15 @@ class ElectroluxEntity(CoordinatorEntity):
         Returns True if remote control status contains 'ENABLED'
         (including 'NOT_SAFETY_RELEVANT_ENABLED') or is None.
         """
-        if not hasattr(self, "appliance_status") or not self.appliance_status:
+        appliance_status = getattr(self, "appliance_status", None)
+        if not appliance_status:
             return False
 
         # Check for remoteControl in the appliance status
-        remote_control_status = self.appliance_status.get("remoteControl")
+        remote_control_status = appliance_status.get("remoteControl")
         if remote_control_status is None:
             # Also check in properties.reported
-            reported = self.appliance_status.get("properties", {}).get("reported", {})
+            reported = appliance_status.get("properties", {}).get("reported", {})
             remote_control_status = reported.get("remoteControl")
 
         _LOGGER.debug(
@@ -487,9 +490,8 @@ class ElectroluxEntity(CoordinatorEntity):
             return True
 
         if remote_control_status:
-            result = "ENABLED" in str(remote_control_status) and "DISABLED" not in str(
-                remote_control_status
-            )
+            status = str(remote_control_status)
+            result = "ENABLED" in status and "DISABLED" not in status
             _LOGGER.debug(
                 "Remote control enabled check for %s: %s -> %s",
                 self.pnc_id,
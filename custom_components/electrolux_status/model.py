@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -12,10 +15,49 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import EntityCategory, Platform
 
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+def enum_values(*names: str) -> Mapping[str, Any]:
+    """Return a read-only catalog "values" map for values without metadata."""
+    return MappingProxyType(dict.fromkeys(names, EMPTY_MAPPING))
+
+
+# Shared "values" maps, referenced by every catalog entry using them
+# instead of repeating the same literal per entity
+OFF_ON_VALUES = enum_values("OFF", "ON")
+CLOSED_OPEN_VALUES = enum_values("CLOSED", "OPEN")
+INSERTED_VALUES = enum_values("INSERTED", "NOT_INSERTED")
+START_STOPRESET_VALUES = enum_values("START", "STOPRESET")
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply read-only copy of a catalog definition."""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen catalog mapping."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class ElectroluxDevice:
-    """Define class for main domain information."""
+    """Define class for main domain information.
+
+    Entries are module-level singletons shared by every appliance, so they are
+    immutable and slotted.
+    """
 
     # use to override the internal naming logic
     # with a name defined in the catalog
@@ -23,7 +65,7 @@ class ElectroluxDevice:
 
     # dictionary of the device capability
     # override and replace bad api data
-    capability_info: dict[str, Any] = field(default_factory=dict)
+    capability_info: Mapping[str, Any] = field(default_factory=dict)
 
     # type used here will override internal definitions / guesstimates
     # entity_platform will override the device_class specified
@@ -54,7 +96,7 @@ class ElectroluxDevice:
     # some entities return a string dict in capabilities but
     # an int in the api values. A defined dictionary can convert
     # those values from integer back to dictionary
-    value_mapping: dict[float, str] = field(default_factory=dict)
+    value_mapping: Mapping[float, str] = field(default_factory=dict)
 
     # some on/off entiites derive their state from different api values
     # for instance, the state of the iceMaker is derived from
@@ -73,10 +115,29 @@ class ElectroluxDevice:
     entity_platform: Platform | None = None
 
     # Custom icons map according to values : useful for execute commands buttons
-    entity_icons_value_map: dict[str, str] | None = None
+    entity_icons_value_map: Mapping[str, str] | None = None
 
     entity_value_named: bool = False
 
+    # (device_class, unit, entity_category, entity_icon) read together by entity
+    # setup, materialized once since the entry is immutable
+    descriptor: tuple[Any, str | None, EntityCategory | None, str | None] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Expose the capability definition read-only, nested values included."""
+        object.__setattr__(self, "capability_info", freeze(self.capability_info))
+        # Icons and units repeat across catalogs, keep one string object for each
+        for name in ("entity_icon", "unit"):
+            if type(value := getattr(self, name)) is str:
+                object.__setattr__(self, name, sys.intern(value))
+        object.__setattr__(
+            self,
+            "descriptor",
+            (self.device_class, self.unit, self.entity_category, self.entity_icon),
+        )
+
 
 class ElectroluxTokenStore(TypedDict):
     """Serialized exposed entities storage storage collection."""
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import copy
+import functools
 import logging
-from typing import TYPE_CHECKING, Any, TypedDict
+import time
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 if TYPE_CHECKING:
     from .entity import ElectroluxEntity
@@ -17,7 +19,7 @@ from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import Platform
 from homeassistant.helpers.entity import EntityCategory
 
-from .catalog_core import CATALOG_BASE, CATALOG_MODEL
+from .catalog_core import get_catalog
 from .const import (
     BINARY_SENSOR,
     BUTTON,
@@ -28,21 +30,63 @@ from .const import (
     STATIC_ATTRIBUTES,
     SWITCH,
 )
+from .model import ElectroluxDevice, thaw
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Bound logger methods, saving the attribute lookup on every log call in the
+# per-capability setup and SSE update paths
+_debug = _LOGGER.debug
+_warning = _LOGGER.warning
+_error = _LOGGER.error
+_exception = _LOGGER.exception
+
+# Entity type implied by the enum a device class belongs to. Enums with members
+# cannot be subclassed, so the exact type of the value is enough.
+_DEVICE_CLASS_ENTITY_TYPES: Mapping[type, Platform] = {
+    BinarySensorDeviceClass: BINARY_SENSOR,
+    ButtonDeviceClass: BUTTON,
+    NumberDeviceClass: NUMBER,
+    SensorDeviceClass: SENSOR,
+    SwitchDeviceClass: SWITCH,
+}
+
+# STATIC_ATTRIBUTES with their nested key paths split once
+_STATIC_ATTRIBUTE_PATHS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (attribute, tuple(attribute.split("/"))) for attribute in STATIC_ATTRIBUTES
+)
 
-def deep_merge_dicts(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
-    """
-    Recursively merge two dictionaries.
-    """
-    result = dict1.copy()
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge_dicts(result[key], value)
+
+def _deep_merge_into(dst: dict[str, Any], src: dict[str, Any]) -> None:
+    """Recursively merge src into dst, in place."""
+    for key, value in src.items():
+        if isinstance(value, dict) and isinstance(dst.get(key), dict):
+            _deep_merge_into(dst[key], value)
         else:
-            result[key] = value
-    return result
+            dst[key] = value
+
+
+@functools.cache
+def _entity_classes() -> dict[Platform, type[ElectroluxEntity]]:
+    """Return the entity class of each platform.
+
+    The platform modules import this one, so they are only imported on first use.
+    """
+    from .binary_sensor import ElectroluxBinarySensor
+    from .button import ElectroluxButton
+    from .number import ElectroluxNumber
+    from .select import ElectroluxSelect
+    from .sensor import ElectroluxSensor
+    from .switch import ElectroluxSwitch
+
+    return {
+        BINARY_SENSOR: ElectroluxBinarySensor,
+        BUTTON: ElectroluxButton,
+        NUMBER: ElectroluxNumber,
+        SELECT: ElectroluxSelect,
+        SENSOR: ElectroluxSensor,
+        SWITCH: ElectroluxSwitch,
+    }
 
 
 class ApplianceState(TypedDict, total=False):
@@ -54,6 +98,8 @@ class ApplianceState(TypedDict, total=False):
 class ApplianceData:
     """Class for appliance data from API."""
 
+    __slots__ = ("_data",)
+
     def __init__(self, data: dict[str, Any]) -> None:
         self._data = data
 
@@ -72,6 +118,24 @@ class Appliance:
     Both represent the unique appliance identifier.
     """
 
+    __slots__ = (
+        "data",
+        "coordinator",
+        "model",
+        "pnc_id",
+        "name",
+        "brand",
+        "state",
+        "entities",
+        "entities_by_type",
+        "last_update_ts",
+        "_catalog_cache",
+        "_constant_keys",
+        "_constant_defaults",
+        "_reported_state",
+        "_appliance_type",
+    )
+
     brand: str
     device: str
     entities: list[Any]
@@ -94,18 +158,38 @@ class Appliance:
         self.pnc_id = pnc_id
         self.name = name
         self.brand = brand
-        self.state: ApplianceState = state
+        self._set_state(state)
         self.entities: list[Any] = []
-        self._catalog_cache: dict[str, Any] | None = None
+        # Entities grouped by entity type, so each platform only sees its own
+        self.entities_by_type: dict[Any, list[Any]] = {}
+        self._catalog_cache: Mapping[str, ElectroluxDevice] | None = None
+        # Constant catalog entries, collected together with the catalog cache
+        self._constant_keys: frozenset[str] = frozenset()
+        self._constant_defaults: tuple[tuple[str, Any], ...] = ()
+        # Monotonic time the state last changed, lets deferred updates skip the API
+        self.last_update_ts: float = 0.0
+
+    def _set_state(self, state: ApplianceState | dict[str, Any]) -> None:
+        """Store a full state and cache the parts read on every update."""
+        self.state: ApplianceState = cast(ApplianceState, state)
+        state_dict = cast(dict[str, Any], state)
+
+        # Attach missing containers so writes to reported_state land in the state
+        properties = state_dict.get("properties")
+        if properties is None:
+            properties = state_dict["properties"] = {}
+        reported = properties.get("reported")
+        if reported is None:
+            reported = properties["reported"] = {}
+        self._reported_state: dict[str, Any] = reported
+
+        appliance_data = state_dict.get("applianceData", {})
+        self._appliance_type: Any = appliance_data.get("applianceType")
 
     @property
     def reported_state(self) -> dict[str, Any]:
         """Return the reported state of the appliance."""
-        from typing import cast
-
-        return (
-            cast(dict[str, Any], self.state).get("properties", {}).get("reported", {})
-        )
+        return self._reported_state
 
     @property
     def appliance_type(self) -> Any:
@@ -115,19 +199,12 @@ class Appliance:
         CR: Refrigerator
         WM: Washing Machine
         """
-        from typing import cast
-
-        return (
-            cast(dict[str, Any], self.state)
-            .get("applianceData", {})
-            .get("applianceType")
-        )
+        return self._appliance_type
 
     def update(self, appliance_status: ApplianceState | dict[str, Any]) -> None:
         """Update appliance status."""
-        from typing import cast
-
-        self.state = cast(ApplianceState, appliance_status)
+        self._set_state(appliance_status)
+        self.last_update_ts = time.monotonic()
         self.initialize_constant_values()
         for entity in self.entities:
             entity.update(self.state)
@@ -138,56 +215,54 @@ class Appliance:
             return
 
         # Initialize constant values from catalog
-        for key, catalog_item in self.catalog.items():
-            if (
-                catalog_item.capability_info.get("access") == "constant"
-                and catalog_item.capability_info.get("default") is not None
-            ):
-                # Only set if not already present in reported_state
-                if key not in self.reported_state:
-                    self.reported_state[key] = catalog_item.capability_info["default"]
-                    _LOGGER.debug(
-                        "Electrolux initialized constant value for %s: %s",
-                        key,
-                        catalog_item.capability_info["default"],
-                    )
+        if self._catalog_cache is None:
+            self._load_catalog()
+        for key, default in self._constant_defaults:
+            # Only set if not already present in reported_state
+            if key not in self.reported_state:
+                self.reported_state[key] = default
+                _debug(
+                    "Electrolux initialized constant value for %s: %s",
+                    key,
+                    default,
+                )
 
     @property
-    def catalog(self) -> dict[str, Any]:
+    def catalog(self) -> Mapping[str, ElectroluxDevice]:
         """Return the defined catalog for the appliance."""
         # Return cached catalog if available
         if self._catalog_cache is not None:
             return self._catalog_cache
-
-        from .catalog_core import CATALOG_BY_TYPE
-
-        # Start with the base catalog
-        new_catalog = copy.deepcopy(CATALOG_BASE)
-
-        # Merge with appliance-type specific catalog if available
-        appliance_type = self.appliance_type
-        if appliance_type in CATALOG_BY_TYPE:
-            type_catalog = CATALOG_BY_TYPE[appliance_type]
-            for key, device in type_catalog.items():
-                new_catalog[key] = device
-
-        # Apply model-specific overrides if available
-        if self.model in CATALOG_MODEL:
-            model_catalog = CATALOG_MODEL[self.model]
-            for key, device in model_catalog.items():
-                new_catalog[key] = device
+        return self._load_catalog()
+
+    def _load_catalog(self) -> Mapping[str, ElectroluxDevice]:
+        """Cache the catalog and collect its constant entries."""
+        # Merged catalogs are built once and shared by appliances of the same model
+        catalog = get_catalog(self.appliance_type, self.model)
+
+        # Constants are looked at on every state update, collect them once
+        self._constant_keys = frozenset(
+            key
+            for key, catalog_item in catalog.items()
+            if catalog_item.capability_info.get("access") == "constant"
+        )
+        self._constant_defaults = tuple(
+            (key, default)
+            for key in self._constant_keys
+            if (default := catalog[key].capability_info.get("default")) is not None
+        )
 
         # Cache and return
-        self._catalog_cache = new_catalog
-        return new_catalog
+        self._catalog_cache = catalog
+        return catalog
 
-    def get_state(self, attr_name: str) -> dict[str, Any] | None:
+    def get_state(self, attr_name: str | tuple[str, ...]) -> dict[str, Any] | None:
         """Retrieve the start from self.reported_state using the attribute name.
 
-        May contain slashes for nested keys.
+        May contain slashes for nested keys, or be given as the already split path.
         """
 
-        keys = attr_name.split("/")
+        keys = attr_name.split("/") if isinstance(attr_name, str) else attr_name
         result: dict[str, Any] | None = self.reported_state
 
         for key in keys:
@@ -199,15 +274,19 @@ class Appliance:
 
         return result if isinstance(result, dict) else None
 
-    def update_reported_data(self, reported_data: dict[str, Any]) -> None:
-        """Update the reported data."""
-        _LOGGER.debug("Electrolux update reported data")
+    def update_reported_data(self, reported_data: dict[str, Any]) -> bool:
+        """Update the reported data.
+
+        Returns whether the reported state changed. Frames repeating the current
+        values return False without touching the entities.
+        """
+        _debug("Electrolux update reported data")
         try:
             # Handle incremental updates with "property" and "value" keys
             if "property" in reported_data and "value" in reported_data:
                 property_name = reported_data["property"]
                 property_value = reported_data["value"]
-                _LOGGER.debug(
+                _debug(
                     "Electrolux incremental update for property: %s",
                     property_name,
                 )
@@ -221,37 +300,50 @@ class Appliance:
 
                     # Navigate to the parent dictionary
                     for part in parts[:-1]:
-                        if part not in target:
-                            target[part] = {}
-                        elif not isinstance(target[part], dict):
-                            _LOGGER.warning(
+                        child = target.get(part)
+                        if child is None:
+                            child = target[part] = {}
+                        elif not isinstance(child, dict):
+                            _warning(
                                 "Cannot update nested property %s: parent %s is not a dict",
                                 property_name,
                                 part,
                             )
-                            return
-                        target = target[part]
+                            return False
+                        target = child
 
                     # Set the final value
+                    if parts[-1] in target and target[parts[-1]] == property_value:
+                        return False
                     target[parts[-1]] = property_value
                 else:
                     # Simple flat property update
+                    if (
+                        property_name in self.reported_state
+                        and self.reported_state[property_name] == property_value
+                    ):
+                        return False
                     self.reported_state[property_name] = property_value
             else:
+                # Electrolux often repeats frames, nothing to do if all values match
+                if all(
+                    key in self.reported_state and self.reported_state[key] == value
+                    for key, value in reported_data.items()
+                ):
+                    return False
+
                 # Handle full state updates - preserve constant values
                 # Store constant values before merge
-                constant_values = {}
-                for key, catalog_item in self.catalog.items():
-                    if (
-                        catalog_item.capability_info.get("access") == "constant"
-                        and key in self.reported_state
-                    ):
-                        constant_values[key] = self.reported_state[key]
+                if self._catalog_cache is None:
+                    self._load_catalog()
+                constant_values = {
+                    key: self.reported_state[key]
+                    for key in self._constant_keys
+                    if key in self.reported_state
+                }
 
                 # Perform the merge
-                self.reported_state.update(
-                    deep_merge_dicts(self.reported_state, reported_data)
-                )
+                _deep_merge_into(self.reported_state, reported_data)
 
                 # Restore constant values that may have been overwritten
                 for key, value in constant_values.items():
@@ -260,45 +352,57 @@ class Appliance:
                     ):  # Only restore if not explicitly updated
                         self.reported_state[key] = value
 
-            _LOGGER.debug("Electrolux updated reported data")
+            _debug("Electrolux updated reported data")
+            self.last_update_ts = time.monotonic()
             for entity in self.entities:
                 entity.update(self.state)
+            return True
 
         except (KeyError, ValueError, TypeError, AttributeError) as ex:
-            _LOGGER.error(
+            _error(
                 "Data validation error updating reported data for %s: %s. Data: %s",
                 self.pnc_id,
                 ex,
                 reported_data,
             )
         except Exception:
-            _LOGGER.exception(
+            _exception(
                 "Unexpected error updating reported data for %s. Data: %s",
                 self.pnc_id,
                 reported_data,
             )
+        # Part of the frame may have been applied before the error
+        return True
 
-    def get_entity(self, capability: str) -> list[ElectroluxEntity]:
-        """Return the entity."""
-        entity_type = self.data.get_entity_type(capability)
-        entity_name = self.data.get_entity_name(capability)
-        entity_attr = self.data.get_entity_attr(capability)
-        category = self.data.get_category(capability)
-        capability_info = self.data.get_capability(capability)
-        device_class = self.data.get_entity_device_class(capability)
+    def get_entity(
+        self, capability: str, *, catalog_item: ElectroluxDevice | None = None
+    ) -> list[ElectroluxEntity]:
+        """Return the entity.
+
+        Callers that already hold the catalog entry can pass it as catalog_item.
+        """
+        (
+            entity_type,
+            entity_name,
+            entity_attr,
+            category,
+            capability_info,
+            device_class,
+            unit,
+            display_name,
+        ) = self.data.get_entity_details(capability)
         entity_category = None
         entity_icon = None
-        unit = self.data.get_entity_unit(capability)
-        display_name = self.data.get_sensor_name(capability)
 
         # get the item definition from the catalog
-        catalog_item = self.catalog.get(capability, None)
+        if catalog_item is None:
+            catalog_item = self.catalog.get(capability, None)
         if catalog_item:
             # Check if catalog specifies a custom entity_source
             if catalog_item.capability_info.get("entity_source"):
                 category = catalog_item.capability_info["entity_source"]
             if capability_info is None:
-                capability_info = catalog_item.capability_info
+                capability_info = thaw(catalog_item.capability_info)
                 # For catalog-only entities, determine entity type from capability_info
                 if entity_type is None and capability_info:
                     cap_type = capability_info.get("type")
@@ -316,114 +420,32 @@ class Appliance:
                         entity_type = SENSOR
             else:
                 # Merge catalog capability_info into API capability_info
-                capability_info.update(catalog_item.capability_info)
+                capability_info.update(thaw(catalog_item.capability_info))
 
-            device_class = catalog_item.device_class
-            unit = catalog_item.unit
-            entity_category = catalog_item.entity_category
-            entity_icon = catalog_item.entity_icon
+            device_class, unit, entity_category, entity_icon = catalog_item.descriptor
 
         # override the api determined type by the catalog entity_type
-        if isinstance(device_class, BinarySensorDeviceClass):
-            entity_type = BINARY_SENSOR
-        if isinstance(device_class, ButtonDeviceClass):
-            entity_type = BUTTON
-        if isinstance(device_class, NumberDeviceClass):
-            entity_type = NUMBER
-        if isinstance(device_class, SensorDeviceClass):
-            entity_type = SENSOR
-        if isinstance(device_class, SwitchDeviceClass):
-            entity_type = SWITCH
+        if (
+            device_class_type := _DEVICE_CLASS_ENTITY_TYPES.get(type(device_class))
+        ) is not None:
+            entity_type = device_class_type
 
         # override the api determined type by the catalog entity_platform
         if catalog_item and isinstance(catalog_item.entity_platform, Platform):
             entity_type = catalog_item.entity_platform
 
-        _LOGGER.debug(
-            "Electrolux get_entity. entity_type: %s entity_name: %s entity_attr: %s entity_source: %s capability: %s device_class: %s unit: %s, catalog: %s",
-            entity_type,
-            entity_name,
-            entity_attr,
-            category,
-            capability_info,
-            device_class,
-            unit,
-            catalog_item,
-        )
-
-        def electrolux_entity_factory(
-            name: str,
-            entity_type: Platform | None,
-            entity_name: str,
-            entity_attr: str,
-            entity_source: str,
-            capability: dict[str, Any] | None,
-            unit: str | None,
-            entity_category: EntityCategory | None,
-            device_class: str | None,
-            icon: str | None,
-            catalog_entry: Any | None,
-            commands: Any | None = None,
-        ):
-            from .binary_sensor import ElectroluxBinarySensor
-            from .button import ElectroluxButton
-            from .number import ElectroluxNumber
-            from .select import ElectroluxSelect
-            from .sensor import ElectroluxSensor
-            from .switch import ElectroluxSwitch
-
-            entity_classes = {
-                BINARY_SENSOR: ElectroluxBinarySensor,
-                BUTTON: ElectroluxButton,
-                NUMBER: ElectroluxNumber,
-                SELECT: ElectroluxSelect,
-                SENSOR: ElectroluxSensor,
-                SWITCH: ElectroluxSwitch,
-            }
-
-            entity_class = entity_classes.get(entity_type) if entity_type else None
-
-            if entity_class is None:
-                _LOGGER.debug("Unknown entity type %s for %s", entity_type, name)
-                raise ValueError(f"Unknown entity type: {entity_type}")
-
-            entity_params = {
-                "coordinator": self.coordinator,
-                "config_entry": self.coordinator.config_entry,
-                "pnc_id": self.pnc_id,
-                "name": name,
-                "entity_type": entity_type,
-                "entity_name": entity_name,
-                "entity_attr": entity_attr,
-                "entity_source": entity_source,
-                "capability": capability,
-                "unit": unit,
-                "entity_category": entity_category,
-                "device_class": device_class,
-                "icon": icon,
-                "catalog_entry": catalog_entry,
-            }
-
-            if commands is None:
-                return [entity_class(**entity_params)]
-
-            entities: list[Any] = []
-            # Replace entity name and icons for multi-entities attribute (one value = one entity)
-            for command in commands:
-                entity = {**entity_params, "val_to_send": command}
-                if catalog_item:
-                    if catalog_item.entity_value_named:
-                        entity["name"] = command
-                    if (
-                        catalog_item.entity_icons_value_map
-                        and catalog_item.entity_icons_value_map.get(command, None)
-                    ):
-                        entity["icon"] = catalog_item.entity_icons_value_map.get(
-                            command
-                        )
-                # Instanciate the new entity and append it
-                entities.append(entity_class(**entity))
-            return entities
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _debug(
+                "Electrolux get_entity. entity_type: %s entity_name: %s entity_attr: %s entity_source: %s capability: %s device_class: %s unit: %s, catalog: %s",
+                entity_type,
+                entity_name,
+                entity_attr,
+                category,
+                capability_info,
+                device_class,
+                unit,
+                catalog_item,
+            )
 
         if entity_type in PLATFORMS:
             commands = (
@@ -431,7 +453,7 @@ class Appliance:
                 if entity_type == BUTTON and capability_info
                 else None
             )
-            return electrolux_entity_factory(
+            return self._create_entities(
                 name=display_name,
                 entity_type=entity_type,
                 entity_name=entity_name,
@@ -448,6 +470,72 @@ class Appliance:
 
         return []
 
+    def _create_entities(
+        self,
+        name: str,
+        entity_type: Platform | None,
+        entity_name: str,
+        entity_attr: str,
+        entity_source: str,
+        capability: dict[str, Any] | None,
+        unit: str | None,
+        entity_category: EntityCategory | None,
+        device_class: str | None,
+        icon: str | None,
+        catalog_entry: ElectroluxDevice | None,
+        commands: Any | None = None,
+    ) -> list[ElectroluxEntity]:
+        """Instantiate the entity, or one entity per command for buttons."""
+        entity_class = _entity_classes().get(entity_type) if entity_type else None
+
+        if entity_class is None:
+            _debug("Unknown entity type %s for %s", entity_type, name)
+            raise ValueError(f"Unknown entity type: {entity_type}")
+
+        entity_params = {
+            "coordinator": self.coordinator,
+            "config_entry": self.coordinator.config_entry,
+            "pnc_id": self.pnc_id,
+            "name": name,
+            "entity_type": entity_type,
+            "entity_name": entity_name,
+            "entity_attr": entity_attr,
+            "entity_source": entity_source,
+            "capability": capability,
+            "unit": unit,
+            "entity_category": entity_category,
+            "device_class": device_class,
+            "icon": icon,
+            "catalog_entry": catalog_entry,
+        }
+
+        if commands is None:
+            return [entity_class(**entity_params)]
+
+        entities: list[Any] = []
+        # Replace entity name and icons for multi-entities attribute (one value = one entity)
+        for command in commands:
+            entity = entity_params.copy()
+            entity["val_to_send"] = command
+            if catalog_entry:
+                if catalog_entry.entity_value_named:
+                    entity["name"] = command
+                if (
+                    catalog_entry.entity_icons_value_map
+                    and catalog_entry.entity_icons_value_map.get(command, None)
+                ):
+                    entity["icon"] = catalog_entry.entity_icons_value_map.get(command)
+            # Instanciate the new entity and append it
+            entities.append(entity_class(**entity))
+        return entities
+
+    def _has_static_attribute(self, name: str, keys: tuple[str, ...]) -> bool:
+        """Return whether a static attribute is in the state or the reported state."""
+        # The top level is a single lookup, only walk the reported state without it
+        if self.state and self.state.get(name) is not None:
+            return True
+        return self.get_state(keys) is not None
+
     def setup(self, data: Any) -> None:
         """Configure the entity."""
         self.data: Any = data
@@ -456,92 +544,98 @@ class Appliance:
         # Extraction of the appliance capabilities & mapping to the known entities of the component
         # [ "applianceState", "autoDosing",..., "userSelections/analogTemperature",...]
         capabilities_names = self.data.sources_list()
+        catalog = self.catalog
 
         if capabilities_names is None and self.state:
             # No capabilities returned (unstable API)
             # We could rebuild them from catalog but this creates entities that are
             # not required by each device type (fridge, dryer, vacumn etc are all different)
-            _LOGGER.warning("Electrolux API returned no capability definition")
+            _warning("Electrolux API returned no capability definition")
 
         # Add static attribute
         # these are attributes that are not in the capability entry
         # but are returned by the api independantly
-        for static_attribute in STATIC_ATTRIBUTES:
-            _LOGGER.debug("Electrolux static_attribute %s", static_attribute)
+        for static_attribute, keys in _STATIC_ATTRIBUTE_PATHS:
+            _debug("Electrolux static_attribute %s", static_attribute)
             # attr not found in state, next attr
-            attr_in_reported = self.get_state(static_attribute) is not None
-            attr_at_top_level = (
-                self.state.get(static_attribute) is not None if self.state else False
-            )
-            if not (attr_in_reported or attr_at_top_level):
+            if not self._has_static_attribute(static_attribute, keys):
                 continue
-            if catalog_item := self.catalog.get(static_attribute, None):
-                if (entity := self.get_entity(static_attribute)) is None:
-                    # catalog definition and automatic checks fail to determine type
-                    _LOGGER.debug(
-                        "Electrolux static_attribute undefined %s", static_attribute
+            if catalog_item := catalog.get(static_attribute, None):
+                if (
+                    entity := self.get_entity(
+                        static_attribute, catalog_item=catalog_item
                     )
+                ) is None:
+                    # catalog definition and automatic checks fail to determine type
+                    _debug("Electrolux static_attribute undefined %s", static_attribute)
                     continue
                 # add to the capability dict
-                keys = static_attribute.split("/")
                 capabilities = self.data.capabilities
                 for key in keys[:-1]:
                     capabilities = capabilities.setdefault(key, {})
-                capabilities[keys[-1]] = catalog_item.capability_info
-                _LOGGER.debug("Electrolux adding static_attribute %s", static_attribute)
+                capabilities[keys[-1]] = thaw(catalog_item.capability_info)
+                _debug("Electrolux adding static_attribute %s", static_attribute)
                 entities.extend(entity)
 
         # Add catalog entities that have capability_info defined, even if not in API capabilities
         # This ensures entities like targetDuration are always created for applicable appliance types
-        for catalog_key, catalog_item in self.catalog.items():
-            if catalog_item.capability_info and catalog_key not in capabilities_names:
+        capability_name_set = set(capabilities_names or ())
+        for catalog_key, catalog_item in catalog.items():
+            if catalog_item.capability_info and catalog_key not in capability_name_set:
                 # Check if this entity should be created for this appliance type
-                if entity := self.get_entity(catalog_key):
-                    _LOGGER.debug(
+                if entity := self.get_entity(catalog_key, catalog_item=catalog_item):
+                    _debug(
                         "Electrolux adding catalog entity %s not in API capabilities",
                         catalog_key,
                     )
-                    entities.extend(list(entity))
+                    entities.extend(entity)
 
         # For each capability src
         if capabilities_names:
             for capability in capabilities_names:
-                if entity := self.get_entity(capability):
-                    entities.extend(list(entity))
+                if entity := self.get_entity(
+                    capability, catalog_item=catalog.get(capability, None)
+                ):
+                    entities.extend(entity)
                 else:
-                    _LOGGER.debug(
-                        "Could not create entity for capability %s", capability
-                    )
+                    _debug("Could not create entity for capability %s", capability)
 
         # Setup each found entity
         # Deduplicate entities by unique_id to prevent duplicates
-        unique_entities = {}
+        unique_entities: dict[str, Any] = {}
         for ent in entities:
-            unique_id = ent.unique_id
-            if unique_id not in unique_entities:
-                unique_entities[unique_id] = ent
-            else:
-                _LOGGER.debug(
-                    "Skipping duplicate entity with unique_id %s for appliance %s",
-                    unique_id,
-                    self.pnc_id,
-                )
+            unique_entities.setdefault(ent.unique_id, ent)
+        if len(unique_entities) != len(entities) and _LOGGER.isEnabledFor(
+            logging.DEBUG
+        ):
+            _debug(
+                "Skipping duplicate entities with unique_id %s for appliance %s",
+                [
+                    ent.unique_id
+                    for ent in entities
+                    if unique_entities[ent.unique_id] is not ent
+                ],
+                self.pnc_id,
+            )
 
         self.entities = list(unique_entities.values())
+        entities_by_type: dict[Any, list[Any]] = {}
         for ent in self.entities:
             ent.setup(data)
+            entities_by_type.setdefault(ent.entity_type, []).append(ent)
+        self.entities_by_type = entities_by_type
 
 
 class Appliances:
     """Appliance class definition."""
 
+    __slots__ = ("appliances", "get_appliance")
+
     def __init__(self, appliances: dict[str, Appliance]) -> None:
         """Initialize the class."""
         self.appliances = appliances
-
-    def get_appliance(self, pnc_id: str) -> Appliance | None:
-        """Return the appliance."""
-        return self.appliances.get(pnc_id, None)
+        # Return the appliance, or None. Bound straight to the dict lookup
+        self.get_appliance: Callable[[str], Appliance | None] = appliances.get
 
     def get_appliances(self) -> dict[str, Appliance]:
         """Return all appliances."""
@@ -1,11 +1,12 @@
 """Number platform for Electrolux Status."""
 
 import logging
+from functools import cached_property
 from typing import Any
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature, UnitOfTime
+from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -22,6 +23,51 @@ from .util import (
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
+def _evaluate_trigger_condition(
+    condition: dict, trigger_cap_name: str, reported_state: dict[str, Any]
+) -> bool:
+    """Evaluate a trigger condition against the reported state."""
+    if not condition:
+        return True
+
+    operator = condition.get("operator", "eq")
+    operand1 = condition.get("operand_1")
+    operand2 = condition.get("operand_2")
+
+    # Handle nested operands
+    if isinstance(operand1, dict):
+        operand1 = _evaluate_operand(operand1, trigger_cap_name, reported_state)
+    if isinstance(operand2, dict):
+        operand2 = _evaluate_operand(operand2, trigger_cap_name, reported_state)
+
+    # Evaluate based on operator
+    if operator == "eq":
+        return operand1 == operand2
+    elif operator == "and":
+        return bool(operand1) and bool(operand2)
+    elif operator == "or":
+        return bool(operand1) or bool(operand2)
+
+    return False
+
+
+def _evaluate_operand(
+    operand: dict, trigger_cap_name: str, reported_state: dict[str, Any]
+) -> Any:
+    """Evaluate a trigger operand."""
+    cap_name = operand.get("operand_1")
+    if cap_name is None and "operand_1" not in operand:
+        # Literal value
+        return operand.get("value")
+    if "operand_2" in operand:
+        # This is a nested condition
+        return _evaluate_trigger_condition(operand, trigger_cap_name, reported_state)
+    if not isinstance(cap_name, str):
+        return None
+    # Reference to another capability, "value" refers to the one with the trigger
+    return reported_state.get(trigger_cap_name if cap_name == "value" else cap_name)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -31,9 +77,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == NUMBER
-            ]
+            entities = appliance.entities_by_type.get(NUMBER, [])
             _LOGGER.debug(
                 "Electrolux add %d NUMBER entities to registry for appliance %s",
                 len(entities),
@@ -45,12 +89,22 @@ async def async_setup_entry(
 class ElectroluxNumber(ElectroluxEntity, NumberEntity):
     """Electrolux Status number class."""
 
-    @property
+    # Program the derived values below were computed for, and the values:
+    # "value", "limits", "constraints", "supported" and "fixed", dropped on
+    # every update
+    _derived: tuple[str | None, dict[str, Any]] | None = None
+
+    @cached_property
+    def _is_temperature_unit(self) -> bool:
+        """Return whether the unit is a temperature, the unit never changes."""
+        return isinstance(self.unit, UnitOfTemperature)
+
+    @cached_property
     def entity_domain(self) -> str:
         """Entity domain for the entry. Used for consistent entity_id."""
         return NUMBER
 
-    @property
+    @cached_property
     def mode(self) -> NumberMode:
         """Return the mode for the number entity."""
         # Use box input for time-based entities (start time and target duration)
@@ -59,7 +113,7 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         # Use slider for other controls with step constraints
         return NumberMode.SLIDER
 
-    @property
+    @cached_property
     def device_class(self) -> NumberDeviceClass | None:
         """Return the device class for the number entity."""
         # For NUMBER entities, we should only return NumberDeviceClass values
@@ -98,6 +152,22 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         if self._cached_value is not None:
             return self._cached_value
 
+        # Reuse the value computed since the last coordinator update
+        derived = self._derived_values()
+        if "value" not in derived:
+            derived["value"] = self._compute_native_value()
+        return derived["value"]
+
+    def _derived_values(self) -> dict[str, Any]:
+        """Return the values derived for the current program since the last update."""
+        program = self._current_program()
+        derived = self._derived
+        if derived is None or derived[0] != program:
+            derived = self._derived = (program, {})
+        return derived[1]
+
+    def _compute_native_value(self) -> float | None:
+        """Compute the value from the reported state, clamped to the program limits."""
         value = self.extract_value()
 
         # Special handling for targetFoodProbeTemperatureC
@@ -134,17 +204,12 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
                 value = 0
         if not value:
             return self._cached_value
-        if isinstance(self.unit, UnitOfTemperature):
+        if self._is_temperature_unit:
             value = round(value, 2)
-
-        # Convert to native units (minutes for time entities)
-        if self.unit == UnitOfTime.SECONDS:
-            # Value is already converted to minutes by reported_state in entity.py
-            pass  # No additional conversion needed
+        # Time values are already converted to minutes by reported_state in entity.py
 
         # Clamp value to current program-specific min/max range
-        min_val = self.native_min_value
-        max_val = self.native_max_value
+        min_val, max_val, _ = self._get_program_constraints()
         if min_val is not None and value < min_val:
             value = min_val
         if max_val is not None and value > max_val:
@@ -156,65 +221,53 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
     @property
     def native_max_value(self) -> float:
         """Return max value: Catalog (Seconds) -> Program -> Appliance API, converted to minutes for UI."""
-        # 1. Catalog is the Source of Truth (already in correct units - seconds)
-        if (
-            self._catalog_entry
-            and (cat_max := self._catalog_entry.capability_info.get("max")) is not None
-        ):
-            # Convert seconds to minutes for UI display
-            if self.unit == UnitOfTime.SECONDS:
-                return float(cat_max // 60)
-            return float(cat_max)
-
-        # 2. Fallback to API/Program logic
-        max_val = self._get_program_constraint("max") or self.capability.get("max")
-
-        # 3. Convert only if coming from API (seconds) and entity is time-based
-        if self.unit == UnitOfTime.SECONDS and max_val is not None:
-            return float(max_val // 60)  # Convert seconds to minutes for UI
-        return float(max_val or 100.0)
+        return self._get_program_constraints()[1]
 
     @property
     def native_min_value(self) -> float:
         """Return min value: Catalog (Seconds) -> Program -> Appliance API, converted to minutes for UI."""
-        if (
-            self._catalog_entry
-            and (cat_min := self._catalog_entry.capability_info.get("min")) is not None
-        ):
-            # Convert seconds to minutes for UI display
-            if self.unit == UnitOfTime.SECONDS:
-                return float(cat_min // 60)
-            return float(cat_min)
-
-        min_val = self._get_program_constraint("min") or self.capability.get("min")
-
-        if self.unit == UnitOfTime.SECONDS and min_val is not None:
-            return float(min_val // 60)  # Convert seconds to minutes for UI
-        return float(min_val or 0.0)
+        return self._get_program_constraints()[0]
 
     @property
     def native_step(self) -> float:
         """Return step value: Catalog (Seconds) -> Program -> Safe Default, converted to minutes for UI."""
+        return self._get_program_constraints()[2]
+
+    def _get_program_constraints(self) -> tuple[float, float, float]:
+        """Return the (min, max, step) limits, cached until the program changes."""
+        derived = self._derived_values()
+        if (limits := derived.get("limits")) is None:
+            limits = derived["limits"] = (
+                self._resolve_limit("min", 0.0),
+                self._resolve_limit("max", 100.0),
+                self._resolve_limit("step", 1.0),
+            )
+        return limits
+
+    def _resolve_limit(self, key: str, default: float) -> float:
+        """Resolve a min/max/step limit, converted to minutes for time entities."""
+        # 1. Catalog is the Source of Truth (already in correct units - seconds)
         if (
             self._catalog_entry
-            and (cat_step := self._catalog_entry.capability_info.get("step"))
-            is not None
+            and (cat_val := self._catalog_entry.capability_info.get(key)) is not None
         ):
             # Convert seconds to minutes for UI display
-            if self.unit == UnitOfTime.SECONDS:
-                return float(cat_step // 60)
-            return float(cat_step)
+            if self._is_seconds_unit:
+                return float(cat_val // 60)
+            return float(cat_val)
 
-        step_val = self._get_program_constraint("step") or self.capability.get("step")
+        # 2. Fallback to API/Program logic
+        val = self._get_program_constraint(key) or self.capability.get(key)
 
-        if self.unit == UnitOfTime.SECONDS and step_val is not None:
-            return float(step_val // 60)  # Convert seconds to minutes for UI
-        return float(step_val or 1.0)
+        # 3. Convert only if coming from API (seconds) and entity is time-based
+        if self._is_seconds_unit and val is not None:
+            return float(val // 60)  # Convert seconds to minutes for UI
+        return float(val or default)
 
-    @property
+    @cached_property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement, converting seconds to minutes for time entities."""
-        if self.unit == UnitOfTime.SECONDS:
+        if self._is_seconds_unit:
             return "min"  # Show 'min' instead of 's' for time entities
         return self.unit
 
@@ -273,8 +326,7 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             )
 
         # ADD RANGE VALIDATION HERE
-        min_val = self.native_min_value
-        max_val = self.native_max_value
+        min_val, max_val, _ = self._get_program_constraints()
 
         if min_val is not None and value < min_val:
             raise ValueError(
@@ -311,7 +363,7 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         )
         # Check for disabled states
         if remote_control is not None and (
-            "ENABLED" not in str(remote_control) or "DISABLED" in str(remote_control)
+            "ENABLED" not in (status := str(remote_control)) or "DISABLED" in status
         ):
             _LOGGER.warning(
                 "Cannot set %s for appliance %s: remote control is %s",
@@ -324,7 +376,8 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             )
 
         # Convert UI minutes back to seconds for time entities
-        if self.unit == UnitOfTime.SECONDS:
+        is_seconds = self._is_seconds_unit
+        if is_seconds:
             # If user sets '1' (minute), send '60' (seconds) to the API
             value = int(value) * 60
 
@@ -339,7 +392,7 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         )
 
         # Update cached value with the constrained value for immediate UI feedback
-        if self.unit == UnitOfTime.SECONDS:
+        if is_seconds:
             # API receives seconds, but UI shows minutes
             self._cached_value = formatted_value // 60
         else:
@@ -428,6 +481,11 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
         _LOGGER.debug("Electrolux set value result %s", result)
         # State will be updated via websocket streaming
 
+    def _handle_coordinator_update(self) -> None:
+        """Drop the cached values, the reported state may have changed."""
+        self._derived = None
+        super()._handle_coordinator_update()
+
     @property
     def available(self) -> bool:
         """Check if the entity is supported and not fixed (step 0)."""
@@ -435,13 +493,17 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             return False
 
         # If the appliance says step is 0, the control is fixed/unavailable
-        if self._get_program_constraint("step") == 0:
-            return False
-
-        return True
+        derived = self._derived_values()
+        if "fixed" not in derived:
+            derived["fixed"] = self._get_program_constraint("step") == 0
+        return not derived["fixed"]
 
     def _is_supported_by_program(self) -> bool:
-        """Check if the entity is supported by the current program."""
+        """Check if the entity is supported by the current program.
+
+        Evaluating the triggers scans every capability, so the result is cached
+        until the program changes or the coordinator delivers new data.
+        """
         # Global entities are always supported by the appliance regardless of program
         if self.entity_attr in [
             "targetDuration",
@@ -450,26 +512,18 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             "targetTemperatureC",
         ]:
             return True
-        current_program = self.reported_state.get("program")
-        if not current_program:
-            return True  # If no program, assume supported
-
-        # Check if the appliance has program-specific capabilities
-        if not (hasattr(self.get_appliance, "data") and self.get_appliance.data):
-            return True
-
-        appliance_data = self.get_appliance.data
-        if not (
-            hasattr(appliance_data, "capabilities") and appliance_data.capabilities
-        ):
+        derived = self._derived_values()
+        if "supported" not in derived:
+            derived["supported"] = self._evaluate_program_support()
+        return derived["supported"]
+
+    def _evaluate_program_support(self) -> bool:
+        """Evaluate the program capabilities and triggers for this entity."""
+        # If no program or no program-specific capabilities, assume supported
+        program_caps = self._program_caps()
+        if program_caps is None:
             return True
 
-        program_caps = (
-            appliance_data.capabilities.get("program", {})
-            .get("values", {})
-            .get(current_program, {})
-        )
-
         # If the entity is not in the program capabilities, it's not supported
         if self.entity_attr not in program_caps:
             # Special check for targetDuration: always available regardless of program
@@ -484,31 +538,23 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
             disabled = entity_cap.get("disabled", False)
 
         # Process triggers that affect this entity
-        all_capabilities = appliance_data.capabilities
-        for cap_name, cap_def in all_capabilities.items():
-            if isinstance(cap_def, dict) and "triggers" in cap_def:
-                for trigger in cap_def["triggers"]:
-                    if isinstance(trigger, dict) and "action" in trigger:
-                        action = trigger["action"]
-                        # Check if this trigger affects our entity
-                        if self.entity_attr in action:
-                            # Check if the condition is met
-                            if self._evaluate_trigger_condition(
-                                trigger.get("condition", {}), cap_name
-                            ):
-                                # Apply the action
-                                entity_action = action[self.entity_attr]
-                                if (
-                                    isinstance(entity_action, dict)
-                                    and "disabled" in entity_action
-                                ):
-                                    disabled = entity_action["disabled"]
-                                    _LOGGER.debug(
-                                        "Trigger applied to %s: disabled=%s (trigger from %s)",
-                                        self.entity_attr,
-                                        disabled,
-                                        cap_name,
-                                    )
+        triggers = self.get_appliance.data.triggers_by_attr.get(self.entity_attr, ())
+        reported_state = self.reported_state if triggers else {}
+        for cap_name, trigger in triggers:
+            # Check if the condition is met
+            if _evaluate_trigger_condition(
+                trigger.get("condition", {}), cap_name, reported_state
+            ):
+                # Apply the action
+                entity_action = trigger["action"][self.entity_attr]
+                if isinstance(entity_action, dict) and "disabled" in entity_action:
+                    disabled = entity_action["disabled"]
+                    _LOGGER.debug(
+                        "Trigger applied to %s: disabled=%s (trigger from %s)",
+                        self.entity_attr,
+                        disabled,
+                        cap_name,
+                    )
 
         # If disabled by triggers or program settings, not supported
         if disabled:
@@ -526,66 +572,50 @@ class ElectroluxNumber(ElectroluxEntity, NumberEntity):
 
         return True
 
+    def _current_program(self) -> str | None:
+        """Return the current program.
+
+        Read straight from the appliance status: reported_state copies the whole
+        state for time entities, only to convert their own value to minutes.
+        """
+        appliance_status = getattr(self, "appliance_status", None)
+        if not appliance_status:
+            return None
+        return appliance_status.get("properties", {}).get("reported", {}).get("program")
+
+    def _program_caps(self) -> dict[str, Any] | None:
+        """Return the capabilities of the current program, None if unknown."""
+        current_program = self._current_program()
+        if not current_program:
+            return None
+        appliance_data = getattr(self.get_appliance, "data", None)
+        if not appliance_data:
+            return None
+        capabilities = getattr(appliance_data, "capabilities", None)
+        if not capabilities:
+            return None
+        return (
+            capabilities.get("program", {}).get("values", {}).get(current_program, {})
+        )
+
     def _get_program_constraint(self, key: str) -> Any | None:
         """Get a specific constraint (min/max/step) for the current program."""
-        current_program = self.reported_state.get("program")
-        if not current_program or not self.get_appliance.data:
-            return None
+        # min, max, step and the fixed check share one walk of the capabilities
+        derived = self._derived_values()
+        if "constraints" not in derived:
+            derived["constraints"] = self._entity_program_constraints()
+        return derived["constraints"].get(key)
+
+    def _entity_program_constraints(self) -> dict[str, Any]:
+        """Return the constraints of this entity in the current program."""
         try:
-            return (
-                self.get_appliance.data.capabilities.get("program", {})
-                .get("values", {})
-                .get(current_program, {})
-                .get(self.entity_attr, {})
-                .get(key)
-            )
+            program_caps = self._program_caps()
         except (AttributeError, KeyError):
-            return None
-
-    def _evaluate_trigger_condition(
-        self, condition: dict, trigger_cap_name: str
-    ) -> bool:
-        """Evaluate a trigger condition."""
-        if not condition:
-            return True
-
-        operator = condition.get("operator", "eq")
-        operand1 = condition.get("operand_1")
-        operand2 = condition.get("operand_2")
-
-        # Handle nested operands
-        if isinstance(operand1, dict):
-            operand1 = self._evaluate_operand(operand1, trigger_cap_name)
-        if isinstance(operand2, dict):
-            operand2 = self._evaluate_operand(operand2, trigger_cap_name)
-
-        # Evaluate based on operator
-        if operator == "eq":
-            return operand1 == operand2
-        elif operator == "and":
-            return bool(operand1) and bool(operand2)
-        elif operator == "or":
-            return bool(operand1) or bool(operand2)
-
-        return False
-
-    def _evaluate_operand(self, operand: dict, trigger_cap_name: str) -> Any:
-        """Evaluate a trigger operand."""
-        if "operand_1" in operand and "operand_2" in operand:
-            # This is a nested condition
-            return self._evaluate_trigger_condition(operand, trigger_cap_name)
-        elif "operand_1" in operand:
-            # Reference to another capability
-            cap_name = operand["operand_1"]
-            if cap_name == "value":
-                # Special case: refers to the capability that has the trigger
-                return self.reported_state.get(trigger_cap_name)
-            else:
-                # Get the value from reported state
-                return self.reported_state.get(cap_name)
-        else:
-            # Literal value
-            return operand.get("value")
+            return {}
+        if not program_caps:
+            return {}
+        entity_cap = program_caps.get(self.entity_attr)
+        return entity_cap if isinstance(entity_cap, dict) else {}
 
     @property
     def entity_registry_enabled_default(self) -> bool:
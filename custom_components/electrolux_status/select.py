@@ -33,9 +33,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SELECT
-            ]
+            entities = appliance.entities_by_type.get(SELECT, [])
             _LOGGER.debug(
                 "Electrolux add %d SELECT entities to registry for appliance %s",
                 len(entities),
@@ -174,7 +172,7 @@ class ElectroluxSelect(ElectroluxEntity, SelectEntity):
         )
         # Check for disabled states
         if remote_control is not None and (
-            "ENABLED" not in str(remote_control) or "DISABLED" in str(remote_control)
+            "ENABLED" not in (status := str(remote_control)) or "DISABLED" in status
         ):
             _LOGGER.warning(
                 "Cannot select option %s for appliance %s: remote control is %s",
@@ -15,6 +15,14 @@ from .util import create_notification, get_capability, time_seconds_to_minutes
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Suggested display precision by unit, units not listed have no suggestion
+_DISPLAY_PRECISION: dict[str | None, int] = {
+    UnitOfTemperature.CELSIUS: 2,
+    UnitOfTemperature.FAHRENHEIT: 2,
+    UnitOfVolume.LITERS: 0,
+    UnitOfTime.SECONDS: 0,
+}
+
 FRIENDLY_NAMES = {
     "ovwater_tank_empty": "Water Tank Status",
     "foodProbeSupported": "Food Probe Support",
@@ -36,9 +44,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SENSOR
-            ]
+            entities = appliance.entities_by_type.get(SENSOR, [])
             _LOGGER.debug(
                 "Electrolux add %d SENSOR entities to registry for appliance %s",
                 len(entities),
@@ -70,15 +76,7 @@ class ElectroluxSensor(ElectroluxEntity, SensorEntity):
     @property
     def suggested_display_precision(self) -> int | None:
         """Get the display precision."""
-        if self.unit == UnitOfTemperature.CELSIUS:
-            return 2
-        if self.unit == UnitOfTemperature.FAHRENHEIT:
-            return 2
-        if self.unit == UnitOfVolume.LITERS:
-            return 0
-        if self.unit == UnitOfTime.SECONDS:
-            return 0
-        return None
+        return _DISPLAY_PRECISION.get(self.unit)
 
     @property
     def native_value(self) -> str | int | float:
@@ -30,9 +30,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SWITCH
-            ]
+            entities = appliance.entities_by_type.get(SWITCH, [])
             _LOGGER.debug(
                 "Electrolux add %d SENSOR entities to registry for appliance %s",
                 len(entities),
@@ -31,9 +31,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == TEXT
-            ]
+            entities = appliance.entities_by_type.get(TEXT, [])
             _LOGGER.debug(
                 "Electrolux add %d TEXT entities to registry for appliance %s",
                 len(entities),
@@ -150,11 +148,24 @@ class ElectroluxText(ElectroluxEntity, TextEntity):
         except AuthenticationError as auth_ex:
             # Handle authentication errors by triggering reauthentication
             await self.coordinator.handle_authentication_error(auth_ex)
+            return
         except Exception as ex:
             # Use shared error mapping for all errors
             raise map_command_error_to_home_assistant_error(
                 ex, self.entity_attr, _LOGGER
             ) from ex
         _LOGGER.debug("Electrolux set text value result %s", result)
-        # await asyncio.sleep(2)
-        await self.coordinator.async_request_refresh()
+        # Show the accepted value right away instead of waiting for a refresh
+        # An incremental frame, so a source path is written into the nested dict
+        appliance = self.get_appliance
+        if (
+            appliance
+            and (path := self.json_path)
+            and appliance.update_reported_data({"property": path, "value": value})
+        ):
+            self.coordinator.async_set_updated_data(self.coordinator.data)
+        # Confirm in the background, the websocket usually delivers the new value
+        # first and the service call should not wait on a refresh of every appliance
+        self.coordinator.hass.async_create_task(
+            self.coordinator.async_request_refresh()
+        )
@@ -719,10 +719,13 @@ class ElectroluxApiClient:
         """Initialize the API client."""
         # Explicitly annotate hass as optional HomeAssistant
         self.hass: HomeAssistant | None = hass
+        # Credentials the client was created with, to tell whether it can be reused
+        self.credentials = (api_key, access_token, refresh_token)
         self._token_manager = TokenManager(access_token, refresh_token, api_key)
         self._client = ApplianceClient(self._token_manager)
         self._token_handler = None  # Track handler
         self._token_logger = None  # Track logger
+        self._listeners: list[tuple[str, Any]] = []  # Track SSE listeners
 
         # Attach token refresh handler to surface token refresh failures as HA issues
         if hass:
@@ -865,10 +868,14 @@ class ElectroluxApiClient:
         if hasattr(self, "_sse_task") and self._sse_task:
             await self.disconnect_websocket()
 
+        # Drop listeners from a previous stream so callbacks are never doubled
+        self._remove_listeners()
+
         try:
             # Add listeners for each appliance
             for appliance_id in appliance_ids:
                 self._client.add_listener(appliance_id, callback)
+                self._listeners.append((appliance_id, callback))
                 _LOGGER.debug("Added SSE listener for appliance %s", appliance_id)
 
             # Start the event stream as a background task (it runs indefinitely)
@@ -942,10 +949,24 @@ class ElectroluxApiClient:
             # Re-raise all exceptions to be handled by the calling entity
             raise
 
+    def _remove_listeners(self) -> None:
+        """Remove the SSE listeners added by this wrapper."""
+        for appliance_id, callback in self._listeners:
+            try:
+                self._client.remove_listener(appliance_id, callback)
+            except ValueError:
+                _LOGGER.debug("SSE listener for %s already removed", appliance_id)
+        self._listeners.clear()
+
+    async def release(self):
+        """Detach from the current coordinator but keep the client reusable."""
+        await self.disconnect_websocket()
+        self._remove_listeners()
+
     async def close(self):
         """Decisive cleanup of resources."""
         # 1. Stop the SSE stream
-        await self.disconnect_websocket()
+        await self.release()
 
         # 2. Remove the logging handler to prevent leaks
         if self._token_handler and self._token_logger:
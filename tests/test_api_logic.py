@@ -161,6 +161,38 @@ class TestKeepSourceLogic:
         assert result is None
 
 
+class TestTriggersByAttr:
+    """Test the trigger index of ElectroluxLibraryEntity."""
+
+    def test_triggers_indexed_by_action_attribute(self):
+        """Test triggers are grouped under every attribute their action touches."""
+        door_trigger = {
+            "condition": {"operand_1": "value", "operand_2": "OPEN"},
+            "action": {"targetTemperatureC": {"disabled": True}, "startTime": {}},
+        }
+        program_trigger = {"action": {"targetTemperatureC": {"disabled": False}}}
+        entity = ElectroluxLibraryEntity(
+            name="test",
+            status="connected",
+            state={},
+            appliance_info={},
+            capabilities={
+                "doorState": {"type": "string", "triggers": [door_trigger]},
+                "program": {"type": "string", "triggers": [program_trigger, "bad"]},
+                "cavityLight": {"type": "boolean"},
+            },
+        )
+
+        index = entity.triggers_by_attr
+        assert index["targetTemperatureC"] == [
+            ("doorState", door_trigger),
+            ("program", program_trigger),
+        ]
+        assert index["startTime"] == [("doorState", door_trigger)]
+        assert "cavityLight" not in index
+        assert entity.triggers_by_attr is index
+
+
 class TestStringToBoolean:
     """Test the string_to_boolean function."""
 
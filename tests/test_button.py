@@ -140,7 +140,7 @@ class TestElectroluxButton:
         button_entity.api.execute_appliance_command = AsyncMock(return_value=True)
 
         # Mock the coordinator update
-        button_entity.coordinator.async_request_refresh = AsyncMock()
+        button_entity.coordinator.async_request_refresh = MagicMock()
 
         await button_entity.async_press()
 
@@ -148,7 +148,9 @@ class TestElectroluxButton:
         button_entity.api.execute_appliance_command.assert_called_once_with(
             "TEST_PNC", {"testAttr": "PRESS"}
         )
-        button_entity.coordinator.async_request_refresh.assert_called_once()
+        button_entity.coordinator.hass.async_create_task.assert_called_once_with(
+            button_entity.coordinator.async_request_refresh.return_value
+        )
 
     @pytest.mark.asyncio
     async def test_press_with_entity_source(self, mock_coordinator, mock_capability):
@@ -182,14 +184,16 @@ class TestElectroluxButton:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_press()
 
         entity.api.execute_appliance_command.assert_called_once_with(
             "TEST_PNC", {"userSelections": {"programUID": "TEST", "testAttr": "PRESS"}}
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
 
     @pytest.mark.asyncio
     async def test_press_api_failure(self, button_entity):
@@ -237,14 +241,16 @@ class TestElectroluxButton:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_press()
 
         entity.api.execute_appliance_command.assert_called_once_with(
             "1:TEST_PNC", {"airConditioner": {"testAttr": "PRESS"}}
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
 
     @pytest.mark.asyncio
     async def test_press_with_legacy_appliance(self, mock_coordinator, mock_capability):
@@ -273,14 +279,16 @@ class TestElectroluxButton:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_press()
 
         entity.api.execute_appliance_command.assert_called_once_with(
             "TEST_PNC", {"testAttr": "PRESS"}
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
 
     def test_device_class_from_catalog(self, mock_coordinator, mock_capability):
         """Test device class from catalog entry."""
@@ -0,0 +1,177 @@
+"""Test the Electrolux Status catalog resolution."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from threading import Barrier
+from types import MappingProxyType
+
+from custom_components.electrolux_status import catalog_core
+from custom_components.electrolux_status.catalog_core import (
+    CATALOG_BASE,
+    _LazyCatalogs,
+    get_catalog,
+)
+from custom_components.electrolux_status.catalog_oven import CATALOG_OVEN
+from custom_components.electrolux_status.catalog_refrigerator import (
+    CATALOG_REFRIGERATOR,
+    EHE6899SA,
+)
+from custom_components.electrolux_status.model import freeze, thaw
+
+
+def test_lazy_catalogs_membership_does_not_import():
+    """Test that membership and iteration never import the catalog module."""
+    catalogs = _LazyCatalogs({"XX": ("catalog_does_not_exist", "CATALOG")})
+
+    assert "XX" in catalogs
+    assert "YY" not in catalogs
+    assert list(catalogs) == ["XX"]
+    assert len(catalogs) == 1
+
+
+def test_lazy_catalogs_merge_base_under_type():
+    """Test that a lazily loaded catalog is merged over the base and cached."""
+    catalogs = _LazyCatalogs(
+        {"OV": ("catalog_oven", "CATALOG_OVEN")}, base=CATALOG_BASE
+    )
+
+    catalog = catalogs["OV"]
+
+    assert catalog is catalogs["OV"]
+    assert catalog["alerts"] is CATALOG_OVEN["alerts"]
+    assert catalog["connectionState"] is CATALOG_BASE["connectionState"]
+
+
+def test_get_catalog_model_overrides_type_and_base():
+    """Test that model entries win over the type catalog, which wins over the base."""
+    catalog = get_catalog("CR", "EHE6899SA")
+
+    assert catalog["uiLockMode"] is EHE6899SA["uiLockMode"]
+    assert catalog["fridge/alerts"] is CATALOG_REFRIGERATOR["fridge/alerts"]
+    assert catalog["connectionState"] is CATALOG_BASE["connectionState"]
+    assert get_catalog("OV", None)["alerts"] is CATALOG_OVEN["alerts"]
+
+
+def test_get_catalog_merge_precedence(monkeypatch):
+    """Test the base, then type, then model precedence on a shared key."""
+    base = MappingProxyType({"shared": "base", "base_only": "base"})
+    by_type = {"TT": MappingProxyType({**base, "shared": "type"})}
+    by_model = {"MM": MappingProxyType({"shared": "model"})}
+    monkeypatch.setattr(catalog_core, "CATALOG_BASE", base)
+    monkeypatch.setattr(catalog_core, "CATALOG_BY_TYPE_MERGED", by_type)
+    monkeypatch.setattr(catalog_core, "SUPPORTED_APPLIANCE_TYPES", frozenset(by_type))
+    monkeypatch.setattr(catalog_core, "CATALOG_MODEL", by_model)
+    monkeypatch.setattr(catalog_core, "_MODEL_CATALOGS", {})
+
+    assert get_catalog("TT", None)["shared"] == "type"
+    assert get_catalog("TT", "MM")["shared"] == "model"
+    assert get_catalog("TT", "MM")["base_only"] == "base"
+    assert get_catalog("XX", "MM")["shared"] == "model"
+
+
+def test_get_catalog_unknown_type_falls_back_to_base():
+    """Test that unsupported appliance types only get the base catalog."""
+    assert get_catalog("XX", "unknown") is CATALOG_BASE
+    assert get_catalog(None, None) is CATALOG_BASE
+
+
+def test_get_catalog_shared_between_appliances_of_a_model():
+    """Test that appliances of the same type and model share one catalog."""
+    assert get_catalog("CR", "EHE6899SA") is get_catalog("CR", "EHE6899SA")
+    assert get_catalog("WM", None) is get_catalog("WM", "other")
+
+
+def test_get_catalog_shared_when_built_from_executor_threads(monkeypatch):
+    """Test that concurrent first builds of a catalog still share one instance."""
+    imported = []
+
+    def slow_import(name, package=None):
+        # Give the other threads time to miss the cache
+        imported.append(name)
+        time.sleep(0.05)
+        return import_module(name, package)
+
+    monkeypatch.setattr(catalog_core, "import_module", slow_import)
+    monkeypatch.setattr(
+        catalog_core,
+        "CATALOG_BY_TYPE_MERGED",
+        _LazyCatalogs(
+            {"CR": ("catalog_refrigerator", "CATALOG_REFRIGERATOR")}, CATALOG_BASE
+        ),
+    )
+    monkeypatch.setattr(
+        catalog_core,
+        "CATALOG_MODEL",
+        _LazyCatalogs({"EHE6899SA": ("catalog_refrigerator", "EHE6899SA")}),
+    )
+    monkeypatch.setattr(catalog_core, "_MODEL_CATALOGS", {})
+    workers = 8
+    barrier = Barrier(workers)
+
+    def build(_):
+        barrier.wait()
+        return get_catalog("CR", "EHE6899SA")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        catalogs = list(executor.map(build, range(workers)))
+
+    assert all(catalog is catalogs[0] for catalog in catalogs)
+    assert len(imported) == 2
+
+
+def test_thaw_freeze_round_trip_returns_plain_containers():
+    """Test that thawing a frozen definition gives back plain dicts and lists."""
+    original = {"values": {"ON": {"icon": "mdi:on"}}, "steps": [1, {"step": 2}]}
+
+    frozen = freeze(original)
+    thawed = thaw(frozen)
+
+    assert isinstance(frozen, MappingProxyType)
+    assert isinstance(frozen["steps"], tuple)
+    assert thawed == original
+    assert type(thawed) is dict
+    assert type(thawed["values"]) is dict
+    assert type(thawed["values"]["ON"]) is dict
+    assert type(thawed["steps"]) is list
+    assert type(thawed["steps"][1]) is dict
+
+
+def test_appliance_collects_constant_entries_once():
+    """Test that an appliance gathers the constant entries with its catalog."""
+    from custom_components.electrolux_status.models import Appliance
+
+    appliance = Appliance(
+        coordinator=None,
+        name="Oven",
+        pnc_id="oven_1",
+        brand="Electrolux",
+        model="",
+        state={"applianceData": {"applianceType": "OV"}},
+    )
+
+    assert appliance.catalog is get_catalog("OV", "")
+    assert appliance._constant_keys == frozenset({"foodProbeSupported"})
+    # No constant in the oven catalog declares a default
+    assert appliance._constant_defaults == ()
+
+
+def test_appliance_reported_state_writes_reach_the_state():
+    """Test that the cached reported state is the dict inside the appliance state."""
+    from custom_components.electrolux_status.models import Appliance
+
+    appliance = Appliance(
+        coordinator=None,
+        name="Oven",
+        pnc_id="oven_1",
+        brand="Electrolux",
+        model="",
+        state={"applianceData": {"applianceType": "OV"}},
+    )
+
+    appliance.reported_state["doorState"] = "OPEN"
+    assert appliance.state["properties"]["reported"] == {"doorState": "OPEN"}
+
+    appliance.update({"properties": {"reported": {"doorState": "CLOSED"}}})
+    assert appliance.reported_state == {"doorState": "CLOSED"}
+    assert appliance.appliance_type is None
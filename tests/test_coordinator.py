@@ -1,5 +1,6 @@
 """Test the Electrolux Status coordinator."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -29,6 +30,9 @@ def mock_coordinator(mock_api_client):
         coord.platforms = []
         coord.renew_interval = 7200
         coord.data = {}  # Initialize as empty dict instead of None
+        coord._request_semaphore = asyncio.Semaphore(2)
+        coord._flush_handle = None
+        coord._last_cleanup_time = 0.0
         return coord
 
 
@@ -129,6 +133,18 @@ async def test_async_update_data_auth_error(mock_coordinator, mock_api_client):
         await mock_coordinator._async_update_data()
 
 
+@pytest.mark.asyncio
+async def test_handle_authentication_error_ignores_case(mock_coordinator):
+    """Test that auth keywords are recognised regardless of case."""
+    from homeassistant.exceptions import ConfigEntryAuthFailed
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await mock_coordinator.handle_authentication_error(Exception("403 Forbidden"))
+
+    # Unrelated errors are left to the caller
+    await mock_coordinator.handle_authentication_error(Exception("Connection reset"))
+
+
 @pytest.mark.asyncio
 async def test_async_update_data_multiple_appliances(mock_coordinator, mock_api_client):
     """Test data update with multiple appliances."""
@@ -177,3 +193,299 @@ async def test_async_update_data_multiple_appliances(mock_coordinator, mock_api_
 
     # Verify the result
     assert result == mock_coordinator.data
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_bounds_concurrency(mock_coordinator, mock_api_client):
+    """Test that no more appliances than the semaphore allows are fetched at once."""
+    in_flight = 0
+    peak = 0
+
+    async def get_state(appliance_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"properties": {"reported": {}}}
+
+    mock_api_client.get_appliance_state = AsyncMock(side_effect=get_state)
+
+    mock_appliances = MagicMock(spec=Appliances)
+    mock_appliances.get_appliances.return_value = {
+        f"appliance_{i}": MagicMock(spec=Appliance) for i in range(5)
+    }
+    mock_coordinator.data = {"appliances": mock_appliances}
+
+    await mock_coordinator._async_update_data()
+
+    assert mock_api_client.get_appliance_state.call_count == 5
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_setup_entities_bounds_concurrency(mock_coordinator, mock_api_client):
+    """Test that setup queries no more appliances at once than the semaphore allows."""
+    from custom_components.electrolux_status import coordinator as coordinator_module
+
+    in_flight = 0
+    peak = 0
+
+    async def setup_appliance(appliance_json):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    mock_api_client.get_appliances_list = AsyncMock(
+        return_value=[{"applianceId": f"appliance_{i}"} for i in range(5)]
+    )
+    mock_coordinator._setup_appliance = setup_appliance
+
+    with (
+        patch.object(coordinator_module, "MAX_CONCURRENT_REQUESTS", 2),
+        patch.object(
+            coordinator_module.asyncio, "timeout", wraps=asyncio.timeout
+        ) as timeout,
+    ):
+        await mock_coordinator.setup_entities()
+
+    assert peak == 2
+    assert mock_coordinator._appliances is mock_coordinator.data["appliances"]
+    # Five appliances two at a time take three rounds, each gets the full budget
+    timeout.assert_called_once_with(coordinator_module.SETUP_TIMEOUT_TOTAL * 3)
+
+
+def test_first_refresh_timeout_scales_with_appliances(mock_coordinator):
+    """Test that the first refresh budget grows with the number of request rounds."""
+    from custom_components.electrolux_status import coordinator as coordinator_module
+
+    mock_appliances = MagicMock(spec=Appliances)
+    mock_appliances.get_appliances.return_value = {
+        f"appliance_{i}": MagicMock(spec=Appliance)
+        for i in range(coordinator_module.MAX_CONCURRENT_REQUESTS + 1)
+    }
+    mock_coordinator.data = {"appliances": mock_appliances}
+
+    assert mock_coordinator.first_refresh_timeout == (
+        coordinator_module.FIRST_REFRESH_TIMEOUT * 2
+    )
+
+    mock_coordinator.data = {}
+    assert mock_coordinator.first_refresh_timeout == (
+        coordinator_module.FIRST_REFRESH_TIMEOUT
+    )
+
+
+def test_websocket_backoff_delay_grows_and_is_capped():
+    """Test that the renewal backoff doubles per failure up to the cap."""
+    from custom_components.electrolux_status import coordinator as coordinator_module
+
+    failures = coordinator_module.WEBSOCKET_MAX_CONSECUTIVE_FAILURES
+    with patch.object(coordinator_module.random, "random", return_value=0.5):
+        assert coordinator_module.websocket_backoff_delay(failures) == (
+            coordinator_module.WEBSOCKET_BACKOFF_DELAY
+        )
+        assert coordinator_module.websocket_backoff_delay(failures + 1) == (
+            coordinator_module.WEBSOCKET_BACKOFF_DELAY * 2
+        )
+        assert coordinator_module.websocket_backoff_delay(failures + 20) == (
+            coordinator_module.WEBSOCKET_BACKOFF_MAX
+        )
+
+    # Jitter stays within +/-50% of the capped delay
+    with patch.object(coordinator_module.random, "random", return_value=0.0):
+        assert coordinator_module.websocket_backoff_delay(failures + 20) == (
+            coordinator_module.WEBSOCKET_BACKOFF_MAX * 0.5
+        )
+
+
+@pytest.mark.asyncio
+async def test_close_websocket_only_closes_once(mock_coordinator, mock_api_client):
+    """Test that a second close does not touch the already closed client."""
+    mock_coordinator.renew_task = None
+    mock_coordinator._deferred_tasks_by_appliance = {}
+    mock_coordinator._closed = False
+    mock_api_client.close = AsyncMock()
+
+    await mock_coordinator.close_websocket()
+    await mock_coordinator.close_websocket()
+
+    mock_api_client.close.assert_awaited_once()
+
+
+def _track_created_tasks(coordinator):
+    """Make hass.async_create_task return a mock task per scheduled coroutine."""
+    tasks = []
+
+    def create_task(coro, *args, **kwargs):
+        coro.close()
+        task = MagicMock()
+        task.done.return_value = False
+        tasks.append(task)
+        return task
+
+    coordinator.hass = MagicMock()
+    coordinator.hass.async_create_task = MagicMock(side_effect=create_task)
+    return tasks
+
+
+def test_incoming_data_keeps_one_deferred_update_per_appliance(mock_coordinator):
+    """Test that both frame shapes share one deferred update per appliance."""
+    appliance = MagicMock(spec=Appliance)
+    appliances = Appliances({"app_1": appliance})
+    mock_coordinator.data = {"appliances": appliances}
+    mock_coordinator._appliances = appliances
+    mock_coordinator._deferred_tasks_by_appliance = {}
+    mock_coordinator.async_set_updated_data = MagicMock()
+    tasks = _track_created_tasks(mock_coordinator)
+
+    # Incremental frame, then a bulk frame for the same appliance
+    mock_coordinator.incoming_data(
+        {"applianceId": "app_1", "property": "timeToEnd", "value": 1}
+    )
+    mock_coordinator.incoming_data({"applianceId": "app_1", "timeToEnd": 1})
+
+    assert len(tasks) == 2
+    tasks[0].cancel.assert_called_once()
+    assert mock_coordinator._deferred_tasks_by_appliance == {"app_1": tasks[1]}
+
+
+def test_cleanup_deferred_keeps_replacement_task(mock_coordinator):
+    """Test that a finished deferred task only untracks itself."""
+    old_task, new_task = MagicMock(), MagicMock()
+    mock_coordinator._deferred_tasks_by_appliance = {"app_1": new_task}
+
+    mock_coordinator._cleanup_deferred("app_1", old_task)
+    assert mock_coordinator._deferred_tasks_by_appliance == {"app_1": new_task}
+
+    mock_coordinator._cleanup_deferred("app_1", new_task)
+    assert mock_coordinator._deferred_tasks_by_appliance == {}
+
+
+def test_incoming_data_skips_deferred_update_outside_threshold(mock_coordinator):
+    """Test that frames not announcing the end of a cycle schedule nothing."""
+    appliance = MagicMock(spec=Appliance)
+    appliances = Appliances({"app_1": appliance})
+    mock_coordinator.data = {"appliances": appliances}
+    mock_coordinator._appliances = appliances
+    mock_coordinator._deferred_tasks_by_appliance = {}
+    mock_coordinator.async_set_updated_data = MagicMock()
+    tasks = _track_created_tasks(mock_coordinator)
+
+    mock_coordinator.incoming_data(
+        {"applianceId": "app_1", "property": "timeToEnd", "value": 600}
+    )
+    mock_coordinator.incoming_data(
+        {"applianceId": "app_1", "property": "doorState", "value": 1}
+    )
+    mock_coordinator.incoming_data({"applianceId": "app_1", "timeToEnd": 0})
+
+    assert tasks == []
+    assert appliance.update_reported_data.call_count == 3
+
+
+def test_incoming_data_coalesces_listener_updates(mock_coordinator):
+    """Test that a burst of SSE frames notifies the listeners once."""
+    from custom_components.electrolux_status import coordinator as coordinator_module
+
+    appliance = MagicMock(spec=Appliance)
+    mock_coordinator._appliances = Appliances({"app_1": appliance})
+    mock_coordinator._deferred_tasks_by_appliance = {}
+    mock_coordinator.async_set_updated_data = MagicMock()
+    _track_created_tasks(mock_coordinator)
+
+    for value in range(3):
+        mock_coordinator.incoming_data(
+            {"applianceId": "app_1", "property": "doorState", "value": value}
+        )
+
+    assert appliance.update_reported_data.call_count == 3
+    mock_coordinator.async_set_updated_data.assert_not_called()
+    call_later = mock_coordinator.hass.loop.call_later
+    call_later.assert_called_once_with(
+        coordinator_module.UPDATE_DEBOUNCE_DELAY, mock_coordinator._flush_update
+    )
+
+    # Firing the timer notifies once and lets the next frame schedule again
+    mock_coordinator._flush_update()
+    mock_coordinator.async_set_updated_data.assert_called_once()
+    assert mock_coordinator._flush_handle is None
+
+
+def test_incoming_data_skips_update_for_unchanged_frames(mock_coordinator):
+    """Test that frames that change nothing do not notify the listeners."""
+    appliance = MagicMock(spec=Appliance)
+    appliance.update_reported_data.return_value = False
+    mock_coordinator._appliances = Appliances({"app_1": appliance})
+    mock_coordinator._deferred_tasks_by_appliance = {}
+    _track_created_tasks(mock_coordinator)
+
+    mock_coordinator.incoming_data(
+        {"applianceId": "app_1", "property": "doorState", "value": 1}
+    )
+    mock_coordinator.incoming_data({"applianceId": "app_1", "doorState": 1})
+
+    assert appliance.update_reported_data.call_count == 2
+    mock_coordinator.hass.loop.call_later.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deferred_update_skipped_after_newer_data(
+    mock_coordinator, mock_api_client
+):
+    """Test that a deferred update does not query the API once newer data arrived."""
+    appliance = MagicMock(spec=Appliance)
+    appliance.last_update_ts = float("inf")
+    appliance.reported_state = {"timeToEnd": 0, "applianceState": "OFF"}
+    mock_coordinator.data = {"appliances": Appliances({"app_1": appliance})}
+    mock_api_client.get_appliance_state = AsyncMock()
+
+    await mock_coordinator.deferred_update("app_1", 0)
+
+    mock_api_client.get_appliance_state.assert_not_called()
+    appliance.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deferred_update_not_skipped_after_unrelated_frame(
+    mock_coordinator, mock_api_client
+):
+    """Test that a frame not touching the cycle end does not cancel the fetch."""
+    appliance = Appliance(
+        coordinator=mock_coordinator,
+        name="Oven",
+        pnc_id="app_1",
+        brand="Electrolux",
+        model="TEST",
+        state={"properties": {"reported": {"timeToEnd": 1, "doorState": "CLOSED"}}},
+    )
+    mock_coordinator.data = {"appliances": Appliances({"app_1": appliance})}
+    final_state = {"properties": {"reported": {"timeToEnd": 0}}}
+    mock_api_client.get_appliance_state = AsyncMock(return_value=final_state)
+    mock_coordinator.async_set_updated_data = MagicMock()
+
+    with patch.object(Appliance, "update", autospec=True) as mock_update:
+        task = asyncio.ensure_future(mock_coordinator.deferred_update("app_1", 0.01))
+        await asyncio.sleep(0)
+        # An unrelated frame arrives while the deferred update waits
+        assert appliance.update_reported_data(
+            {"property": "doorState", "value": "OPEN"}
+        )
+        await task
+
+    mock_api_client.get_appliance_state.assert_awaited_once_with("app_1")
+    mock_update.assert_called_once_with(appliance, final_state)
+
+
+def test_incoming_data_before_setup_is_ignored(mock_coordinator):
+    """Test that frames arriving before setup_entities are dropped."""
+    mock_coordinator._appliances = None
+    mock_coordinator.async_set_updated_data = MagicMock()
+
+    mock_coordinator.incoming_data(
+        {"applianceId": "app_1", "property": "timeToEnd", "value": 1}
+    )
+
+    mock_coordinator.async_set_updated_data.assert_not_called()
@@ -1,8 +1,187 @@
 """Test the Electrolux Status integration setup."""
 
-from custom_components.electrolux_status.const import DOMAIN
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.electrolux_status import (
+    CLIENT_CACHE,
+    async_remove_entry,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.electrolux_status.const import (
+    CONF_ACCESS_TOKEN,
+    CONF_API_KEY,
+    CONF_REFRESH_TOKEN,
+    DOMAIN,
+)
+
+CREDENTIALS = ("api", "access", "refresh")
 
 
 def test_domain():
     """Test that the domain is correct."""
     assert DOMAIN == "electrolux_status"
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock hass that runs created tasks on the test loop."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.async_create_task = MagicMock(
+        side_effect=lambda coro, *args, **kwargs: asyncio.ensure_future(coro)
+    )
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    return hass
+
+
+@pytest.fixture
+def mock_entry():
+    """Create a mock config entry."""
+    entry = MagicMock()
+    entry.entry_id = "entry_1"
+    entry.title = "Electrolux"
+    entry.data = {
+        CONF_API_KEY: CREDENTIALS[0],
+        CONF_ACCESS_TOKEN: CREDENTIALS[1],
+        CONF_REFRESH_TOKEN: CREDENTIALS[2],
+    }
+    return entry
+
+
+def _cached_client(credentials):
+    """Create a cached API client for the given credentials."""
+    client = MagicMock()
+    client.credentials = credentials
+    client.close = AsyncMock()
+    client.release = AsyncMock()
+    return client
+
+
+async def _setup_entry(hass, entry):
+    """Run async_setup_entry with a coordinator that always succeeds."""
+    coordinator = MagicMock()
+    coordinator.async_login = AsyncMock(return_value=True)
+    coordinator.setup_entities = AsyncMock()
+    coordinator.listen_websocket = AsyncMock()
+    coordinator.async_config_entry_first_refresh = AsyncMock()
+    coordinator.first_refresh_timeout = 15.0
+    coordinator.last_update_success = True
+
+    new_client = _cached_client(CREDENTIALS)
+    with (
+        patch(
+            "custom_components.electrolux_status.ElectroluxCoordinator",
+            return_value=coordinator,
+        ) as coordinator_class,
+        patch(
+            "custom_components.electrolux_status.get_electrolux_session",
+            return_value=new_client,
+        ) as get_session,
+        patch("custom_components.electrolux_status.async_get_clientsession"),
+        patch("custom_components.electrolux_status.async_at_started"),
+    ):
+        assert await async_setup_entry(hass, entry)
+
+    return coordinator_class.call_args.kwargs["client"], get_session
+
+
+@pytest.mark.asyncio
+async def test_setup_reuses_cached_client(mock_hass, mock_entry):
+    """Test that a reload with unchanged credentials keeps the cached client."""
+    cached = _cached_client(CREDENTIALS)
+    mock_hass.data[DOMAIN] = {
+        CLIENT_CACHE: {mock_entry.entry_id: (CREDENTIALS, cached)}
+    }
+
+    client, get_session = await _setup_entry(mock_hass, mock_entry)
+
+    assert client is cached
+    get_session.assert_not_called()
+    cached.close.assert_not_awaited()
+    assert mock_entry.entry_id not in mock_hass.data[DOMAIN][CLIENT_CACHE]
+
+
+@pytest.mark.asyncio
+async def test_setup_replaces_client_with_changed_credentials(mock_hass, mock_entry):
+    """Test that changed credentials close the cached client and create a new one."""
+    stale = _cached_client(("api", "old_access", "old_refresh"))
+    mock_hass.data[DOMAIN] = {
+        CLIENT_CACHE: {mock_entry.entry_id: (stale.credentials, stale)}
+    }
+
+    client, get_session = await _setup_entry(mock_hass, mock_entry)
+
+    stale.close.assert_awaited_once()
+    get_session.assert_called_once()
+    assert client is get_session.return_value
+
+
+@pytest.mark.asyncio
+async def test_unload_caches_released_client(mock_hass, mock_entry):
+    """Test that unload releases the client and keeps it for the next setup."""
+    client = _cached_client(CREDENTIALS)
+    coordinator = MagicMock()
+    coordinator.api = client
+    coordinator.cancel_pending_tasks = AsyncMock()
+    mock_hass.data[DOMAIN] = {mock_entry.entry_id: coordinator}
+
+    assert await async_unload_entry(mock_hass, mock_entry)
+
+    coordinator.cancel_pending_tasks.assert_awaited_once()
+    client.release.assert_awaited_once()
+    client.close.assert_not_awaited()
+    assert mock_entry.entry_id not in mock_hass.data[DOMAIN]
+    assert mock_hass.data[DOMAIN][CLIENT_CACHE][mock_entry.entry_id] == (
+        CREDENTIALS,
+        client,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unload_cancels_pending_deferred_update(mock_hass, mock_entry):
+    """Test that unload cancels the coordinator tasks without closing the client."""
+    from custom_components.electrolux_status.coordinator import ElectroluxCoordinator
+
+    client = _cached_client(CREDENTIALS)
+    coordinator = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
+    coordinator.api = client
+    renew_task = asyncio.ensure_future(asyncio.sleep(3600))
+    coordinator.renew_task = renew_task
+    # The renewal must be stopped before the client is released into the cache
+    renew_done_on_release = []
+    client.release.side_effect = lambda: renew_done_on_release.append(renew_task.done())
+    coordinator._flush_handle = MagicMock()
+    flush_handle = coordinator._flush_handle
+    deferred = asyncio.ensure_future(asyncio.sleep(70))
+    coordinator._deferred_tasks_by_appliance = {"app_1": deferred}
+    mock_hass.data[DOMAIN] = {mock_entry.entry_id: coordinator}
+
+    assert await async_unload_entry(mock_hass, mock_entry)
+
+    assert renew_task.cancelled()
+    assert deferred.cancelled()
+    assert coordinator._deferred_tasks_by_appliance == {}
+    flush_handle.cancel.assert_called_once()
+    assert coordinator._flush_handle is None
+    client.close.assert_not_awaited()
+    client.release.assert_awaited_once()
+    assert renew_done_on_release == [True]
+
+
+@pytest.mark.asyncio
+async def test_remove_entry_closes_cached_client(mock_hass, mock_entry):
+    """Test that removing the entry closes its cached client."""
+    cached = _cached_client(CREDENTIALS)
+    mock_hass.data[DOMAIN] = {
+        CLIENT_CACHE: {mock_entry.entry_id: (CREDENTIALS, cached)}
+    }
+
+    await async_remove_entry(mock_hass, mock_entry)
+
+    cached.close.assert_awaited_once()
+    assert mock_hass.data[DOMAIN][CLIENT_CACHE] == {}
@@ -8,7 +8,10 @@ from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.electrolux_status.const import NUMBER
-from custom_components.electrolux_status.number import ElectroluxNumber
+from custom_components.electrolux_status.number import (
+    ElectroluxNumber,
+    _evaluate_trigger_condition,
+)
 
 
 class TestElectroluxNumber:
@@ -216,6 +219,20 @@ class TestElectroluxNumber:
         entity.reported_state = {"foodProbeInsertionState": "NOT_INSERTED"}
         assert entity.native_value == 0.0
 
+    def test_native_value_cached_until_coordinator_update(
+        self, mock_coordinator, number_entity
+    ):
+        """Test an unsupported value is not recomputed until new data arrives."""
+        number_entity._is_supported_by_program = MagicMock(return_value=False)
+        assert number_entity.native_value is None
+        assert number_entity.native_value is None
+        assert number_entity._is_supported_by_program.call_count == 1
+
+        number_entity._is_supported_by_program.return_value = True
+        mock_coordinator.data = None
+        number_entity._handle_coordinator_update()
+        assert number_entity.native_value == 75
+
     def test_native_max_value_program_specific(self, number_entity):
         """Test max value from program-specific constraints."""
         number_entity._get_program_constraint = MagicMock(return_value=80)
@@ -226,6 +243,72 @@ class TestElectroluxNumber:
         number_entity._get_program_constraint = MagicMock(return_value=None)
         assert number_entity.native_max_value == 100
 
+    def test_program_constraint_from_program_capabilities(
+        self, mock_coordinator, number_entity
+    ):
+        """Test min/max/step are read from the current program capabilities."""
+        appliance = MagicMock()
+        appliance.data.capabilities = {
+            "program": {
+                "values": {
+                    "COTTON": {"testAttr": {"min": 10, "max": 60, "step": 5}},
+                    "EMPTY": {},
+                }
+            }
+        }
+        mock_coordinator.data = {"appliances": MagicMock()}
+        mock_coordinator.data["appliances"].get_appliance.return_value = appliance
+
+        number_entity.reported_state = {"program": "COTTON"}
+        assert number_entity._get_program_constraint("min") == 10
+        assert number_entity.native_max_value == 60
+        assert number_entity.native_step == 5
+        assert number_entity._is_supported_by_program()
+
+        number_entity.reported_state = {"program": "EMPTY"}
+        assert number_entity._get_program_constraint("max") is None
+        assert not number_entity._is_supported_by_program()
+
+        number_entity.reported_state = {}
+        assert number_entity._get_program_constraint("max") is None
+        assert number_entity._is_supported_by_program()
+
+    def test_limits_cached_per_program(self, mock_coordinator, number_entity):
+        """Test limits are cached until the program or coordinator data changes."""
+        number_entity._get_program_constraint = MagicMock(return_value=80)
+        number_entity.reported_state = {"program": "COTTON"}
+        assert number_entity.native_max_value == 80
+        calls = number_entity._get_program_constraint.call_count
+        assert number_entity.native_max_value == 80
+        assert number_entity.native_min_value == 80
+        assert number_entity._get_program_constraint.call_count == calls
+
+        number_entity._get_program_constraint.return_value = 40
+        number_entity.reported_state = {"program": "WOOL"}
+        assert number_entity.native_max_value == 40
+
+        number_entity._get_program_constraint.return_value = 30
+        mock_coordinator.data = None
+        number_entity._handle_coordinator_update()
+        assert number_entity.native_max_value == 30
+
+    def test_program_support_cached_per_program(self, mock_coordinator, number_entity):
+        """Test program support is cached until the program or data changes."""
+        number_entity._program_caps = MagicMock(return_value={})
+        number_entity.reported_state = {"program": "COTTON"}
+        assert not number_entity._is_supported_by_program()
+        assert not number_entity._is_supported_by_program()
+        assert number_entity._program_caps.call_count == 1
+
+        number_entity._program_caps.return_value = {"testAttr": {}}
+        number_entity.reported_state = {"program": "WOOL"}
+        assert number_entity._is_supported_by_program()
+
+        number_entity._program_caps.return_value = {}
+        mock_coordinator.data = None
+        number_entity._handle_coordinator_update()
+        assert not number_entity._is_supported_by_program()
+
     def test_native_max_value_time_conversion(self, mock_coordinator):
         """Test max value time conversion for time entities."""
         capability = {
@@ -430,3 +513,21 @@ class TestElectroluxNumber:
         """Test that entity is unavailable when not supported by program."""
         number_entity._is_supported_by_program = MagicMock(return_value=False)
         assert not number_entity.available
+
+
+def test_evaluate_trigger_condition():
+    """Test trigger conditions are evaluated against the given reported state."""
+    reported_state = {"doorState": "OPEN", "cavityLight": True}
+    door_open = {"operand_1": {"operand_1": "value"}, "operand_2": "OPEN"}
+    assert _evaluate_trigger_condition(door_open, "doorState", reported_state)
+    assert not _evaluate_trigger_condition(door_open, "doorState", {})
+    light_and_door = {
+        "operator": "and",
+        "operand_1": {"operand_1": "cavityLight"},
+        "operand_2": door_open,
+    }
+    assert _evaluate_trigger_condition(light_and_door, "doorState", reported_state)
+    assert _evaluate_trigger_condition({}, "doorState", {})
+    assert not _evaluate_trigger_condition(
+        {"operator": "xor", "operand_1": 1, "operand_2": 1}, "doorState", {}
+    )
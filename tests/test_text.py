@@ -6,6 +6,7 @@ import pytest
 from homeassistant.const import EntityCategory
 
 from custom_components.electrolux_status.const import TEXT
+from custom_components.electrolux_status.models import Appliance
 from custom_components.electrolux_status.text import ElectroluxText
 
 
@@ -238,7 +239,7 @@ class TestElectroluxText:
         text_entity.api.execute_appliance_command = AsyncMock(return_value=True)
 
         # Mock the coordinator update
-        text_entity.coordinator.async_request_refresh = AsyncMock()
+        text_entity.coordinator.async_request_refresh = MagicMock()
 
         await text_entity.async_set_value("new value")
 
@@ -246,7 +247,9 @@ class TestElectroluxText:
         text_entity.api.execute_appliance_command.assert_called_once_with(
             "TEST_PNC", {"testAttr": "new value"}
         )
-        text_entity.coordinator.async_request_refresh.assert_called_once()
+        text_entity.coordinator.hass.async_create_task.assert_called_once_with(
+            text_entity.coordinator.async_request_refresh.return_value
+        )
 
     @pytest.mark.asyncio
     async def test_set_value_with_entity_source(
@@ -281,7 +284,7 @@ class TestElectroluxText:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_set_value("new value")
 
@@ -289,7 +292,83 @@ class TestElectroluxText:
             "TEST_PNC",
             {"userSelections": {"programUID": "TEST", "testAttr": "new value"}},
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_value_updates_state_optimistically(self, text_entity):
+        """Test the accepted value is pushed to listeners without waiting."""
+        appliance = MagicMock()
+        appliance.update_reported_data.return_value = True
+        text_entity.coordinator.data = {"appliances": MagicMock()}
+        text_entity.coordinator.data["appliances"].get_appliance.return_value = (
+            appliance
+        )
+        text_entity.api.execute_appliance_command = AsyncMock(return_value=True)
+        text_entity.coordinator.async_request_refresh = MagicMock()
+
+        await text_entity.async_set_value("new value")
+
+        appliance.update_reported_data.assert_called_once_with(
+            {"property": "testAttr", "value": "new value"}
+        )
+        text_entity.coordinator.async_set_updated_data.assert_called_once_with(
+            text_entity.coordinator.data
+        )
+        text_entity.coordinator.hass.async_create_task.assert_called_once_with(
+            text_entity.coordinator.async_request_refresh.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_value_updates_nested_source_optimistically(
+        self, mock_coordinator, mock_capability
+    ):
+        """Test an entity source value is written into the nested reported dict."""
+        entity = ElectroluxText(
+            coordinator=mock_coordinator,
+            capability=mock_capability,
+            name="Test Text",
+            config_entry=mock_coordinator.config_entry,
+            pnc_id="TEST_PNC",
+            entity_type=TEXT,
+            entity_name="test_text",
+            entity_attr="testAttr",
+            entity_source="userSelections",
+            unit="",
+            device_class="",
+            entity_category=EntityCategory.CONFIG,
+            icon="mdi:test",
+            catalog_entry=None,
+        )
+        appliance = Appliance(
+            coordinator=None,
+            name="Washer",
+            pnc_id="TEST_PNC",
+            brand="Electrolux",
+            model="",
+            state={
+                "properties": {
+                    "reported": {
+                        "userSelections": {"programUID": "TEST", "testAttr": "old"}
+                    }
+                }
+            },
+        )
+        entity.appliance_status = appliance.state
+        mock_coordinator.data = {"appliances": MagicMock()}
+        mock_coordinator.data["appliances"].get_appliance.return_value = appliance
+        entity.api.execute_appliance_command = AsyncMock(return_value=True)
+        entity.coordinator.async_request_refresh = MagicMock()
+
+        await entity.async_set_value("new value")
+
+        assert appliance.reported_state == {
+            "userSelections": {"programUID": "TEST", "testAttr": "new value"}
+        }
+        mock_coordinator.async_set_updated_data.assert_called_once_with(
+            mock_coordinator.data
+        )
 
     @pytest.mark.asyncio
     async def test_set_value_api_failure(self, text_entity):
@@ -340,14 +419,16 @@ class TestElectroluxText:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_set_value("new value")
 
         entity.api.execute_appliance_command.assert_called_once_with(
             "1:TEST_PNC", {"airConditioner": {"testAttr": "new value"}}
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
 
     @pytest.mark.asyncio
     async def test_set_value_with_legacy_appliance(
@@ -379,14 +460,16 @@ class TestElectroluxText:
         }
 
         entity.api.execute_appliance_command = AsyncMock(return_value=True)
-        entity.coordinator.async_request_refresh = AsyncMock()
+        entity.coordinator.async_request_refresh = MagicMock()
 
         await entity.async_set_value("new value")
 
         entity.api.execute_appliance_command.assert_called_once_with(
             "TEST_PNC", {"testAttr": "new value"}
         )
-        entity.coordinator.async_request_refresh.assert_called_once()
+        entity.coordinator.hass.async_create_task.assert_called_once_with(
+            entity.coordinator.async_request_refresh.return_value
+        )
 
     def test_mode_from_catalog(self, mock_coordinator, mock_capability):
         """Test mode from catalog entry."""
@@ -1,6 +1,6 @@
 """Tests for Electrolux util helpers."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -62,3 +62,50 @@ async def test_report_token_refresh_no_hass_does_not_create_issue(monkeypatch):
     await client._report_token_refresh_error("No HA available")
 
     assert "called" not in called
+
+
+@pytest.fixture
+def sse_client():
+    """Create an API client with a mocked SDK appliance client."""
+    from custom_components.electrolux_status.util import ElectroluxApiClient
+
+    client = ElectroluxApiClient("api", "access", "refresh", hass=None)
+    client._client = MagicMock()
+    client._client.start_event_stream = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_release_removes_listeners(sse_client):
+    """Assert release() detaches the SDK listeners from the old coordinator."""
+    callback = MagicMock()
+    await sse_client.watch_for_appliance_state_updates(["app_1", "app_2"], callback)
+
+    await sse_client.release()
+
+    sse_client._client.remove_listener.assert_any_call("app_1", callback)
+    sse_client._client.remove_listener.assert_any_call("app_2", callback)
+    assert sse_client._listeners == []
+
+
+@pytest.mark.asyncio
+async def test_watch_twice_does_not_double_listeners(sse_client):
+    """Assert restarting the stream replaces the listeners instead of adding more."""
+    old_callback = MagicMock()
+    new_callback = MagicMock()
+    await sse_client.watch_for_appliance_state_updates(["app_1"], old_callback)
+    await sse_client.watch_for_appliance_state_updates(["app_1"], new_callback)
+
+    sse_client._client.remove_listener.assert_called_once_with("app_1", old_callback)
+    assert sse_client._listeners == [("app_1", new_callback)]
+
+
+@pytest.mark.asyncio
+async def test_release_tolerates_missing_listener(sse_client):
+    """Assert a listener the SDK already dropped does not break release()."""
+    await sse_client.watch_for_appliance_state_updates(["app_1"], MagicMock())
+    sse_client._client.remove_listener.side_effect = ValueError
+
+    await sse_client.release()
+
+    assert sse_client._listeners == []